@@ -0,0 +1,230 @@
+"""
+GitHub Copilot Q&A Generator - build benchmarks
+Renders synthetic topics of increasing size through generate_topics and
+records wall time, peak RSS and output size, so changes to the generator
+can be compared against a saved baseline.
+
+    python benchmark_topics.py                          # run and print
+    python benchmark_topics.py --save benchmarks/baseline.json
+    python benchmark_topics.py --compare benchmarks/baseline.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+from collections.abc import Sequence
+
+import generate_topics
+
+DEFAULT_SIZES = [10, 1_000, 100_000, 1_000_000]
+
+# Fail --compare when a metric grows by more than this fraction
+DEFAULT_TOLERANCE = 0.20
+# ...and by more than this much, so timer noise on millisecond cases doesn't count
+METRIC_FLOORS = {"seconds": 0.05, "peak_rss_kb": 2048}
+
+# Each case is timed this many times and the fastest run is kept
+DEFAULT_REPEATS = 3
+
+# Metrics checked by --compare; output size must not change at all
+TIMED_METRICS = ("seconds", "peak_rss_kb")
+
+class SyntheticQA(Sequence):
+    """Q&A pairs shaped like the real content: prose, a list and a code block.
+
+    Items are made when they are accessed, so a case's peak RSS measures
+    rendering rather than holding the input, like a PackedTopic.
+    """
+
+    def __init__(self, count, answer_words):
+        self.count = count
+        self.words = " ".join(f"word{i % 97}" for i in range(answer_words))
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        i = index
+        return (f"Synthetic question {i}: how does feature {i % 101} work?", f"""
+                    <strong>Answer {i}:</strong> {self.words}
+                    <ul>
+                        <li>First point about item {i}</li>
+                        <li>Second point about item {i}</li>
+                    </ul>
+                    <div class="code-block">gh copilot suggest "item {i}"</div>
+        """)
+
+def peak_rss_kb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+def run_synthetic(count, answer_words, options, repeats=DEFAULT_REPEATS):
+    """Build one synthetic topic in this process and return its measurements (best of repeats)."""
+    topic = {
+        "num": 0,
+        "filename": "synthetic.html",
+        "title": f"Synthetic topic ({count:,} questions)",
+        "subtitle": "Benchmark",
+    }
+    start = time.perf_counter()
+    qa_list = SyntheticQA(count, answer_words)
+    load_seconds = time.perf_counter() - start
+
+    seconds = float("inf")
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = Path(tmp) / topic["filename"]
+        for _ in range(repeats):
+            filepath.unlink(missing_ok=True)
+            start = time.perf_counter()
+            _, _, size, variants = generate_topics.write_stream(
+                filepath, generate_topics.iter_topic(topic, qa_list, options), options.get("compress"))
+            seconds = min(seconds, time.perf_counter() - start)
+
+    return {
+        "items": count,
+        "load_seconds": round(load_seconds, 4),
+        "seconds": round(seconds, 4),
+        "peak_rss_kb": peak_rss_kb(),
+        "output_bytes": size,
+        "compressed_bytes": variants,
+    }
+
+def run_corpus(options, repeats=DEFAULT_REPEATS):
+    """Time a full generate_all_topics() build of the real content (best of repeats).
+
+    Each build goes to a fresh directory, so none of them is incremental;
+    parsed content stays cached in the process after the first.
+    """
+    seconds = float("inf")
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            generate_topics.generate_all_topics(
+                tmp, compress=options.get("compress", False), minify=options.get("minify", False),
+                lazy_answers=options.get("lazy_answers", False))
+            seconds = min(seconds, time.perf_counter() - start)
+            size = sum(p.stat().st_size for p in Path(tmp).glob("*.html"))
+    return {
+        "items": "corpus",
+        "seconds": round(seconds, 4),
+        "peak_rss_kb": peak_rss_kb(),
+        "output_bytes": size,
+    }
+
+def run_isolated(case, answer_words, options, repeats=DEFAULT_REPEATS):
+    """Run one case in a fresh interpreter so peak RSS belongs to that case alone."""
+    cmd = [sys.executable, __file__, "--child", str(case), "--answer-words", str(answer_words),
+           "--repeats", str(repeats), "--options", json.dumps(options)]
+    # A fixed hub date keeps content_date() from timing a git subprocess
+    env = dict(os.environ, SOURCE_DATE_EPOCH=os.environ.get("SOURCE_DATE_EPOCH") or "0")
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=True, env=env,
+                          cwd=Path(__file__).resolve().parent)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def compare(results, baseline, tolerance):
+    """Print the change against a baseline run; returns the list of regressions."""
+    previous = {str(r["items"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get(str(result["items"]))
+        if not old:
+            continue
+        for metric in TIMED_METRICS:
+            if not old[metric]:
+                continue
+            change = result[metric] / old[metric] - 1
+            print(f"   {result['items']!s:>9} {metric:<12} {old[metric]:>12} → {result[metric]:>12} "
+                  f"({change:+.0%})")
+            if change > tolerance and result[metric] - old[metric] > METRIC_FLOORS[metric]:
+                regressions.append((result["items"], metric, change))
+        if result["output_bytes"] != old["output_bytes"]:
+            regressions.append((result["items"], "output_bytes", None))
+            print(f"   {result['items']!s:>9} output_bytes {old['output_bytes']:>12} → "
+                  f"{result['output_bytes']:>12} (changed)")
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the GitHub Copilot Q&A topic generator")
+    parser.add_argument("--sizes", type=lambda s: [int(n) for n in s.split(",")], default=DEFAULT_SIZES,
+                        help="comma-separated Q&A counts to build (default: 10,1000,100000,1000000)")
+    parser.add_argument("--answer-words", type=int, default=40,
+                        help="words of filler text per synthetic answer (default: 40)")
+    parser.add_argument("--minify", action="store_true", help="benchmark with --minify output")
+    parser.add_argument("--lazy-answers", action="store_true", help="benchmark with --lazy-answers output")
+    parser.add_argument("--compress", action="store_true", help="benchmark with --compress output")
+    parser.add_argument("--save", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="compare the results with this baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown/memory growth before --compare fails (default: 0.20)")
+    parser.add_argument("--repeats", type=generate_topics.positive_int, default=DEFAULT_REPEATS,
+                        help="time each case this many times and keep the fastest (default: 3)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--options", default="{}", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.child:
+        # Inside the isolated worker: print one JSON line and exit
+        options = json.loads(args.options)
+        if args.child == "corpus":
+            # Keep the build's progress output off the result line
+            sys.stdout = sys.stderr
+            result = run_corpus(options, args.repeats)
+            sys.stdout = sys.__stdout__
+        else:
+            result = run_synthetic(int(args.child), args.answer_words, options, args.repeats)
+        print(json.dumps(result))
+        return 0
+
+    options = {"minify": args.minify, "lazy_answers": args.lazy_answers, "compress": args.compress}
+    results = []
+    for case in ["corpus"] + args.sizes:
+        result = run_isolated(case, args.answer_words, options, args.repeats)
+        results.append(result)
+        print(f"⏱️  {result['items']!s:>9} items: {result['seconds']:8.3f} s, "
+              f"peak RSS {result['peak_rss_kb'] / 1024:8.1f} MB, {result['output_bytes']:>14,} B")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "answer_words": args.answer_words,
+        "options": options,
+        "results": results,
+    }
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"💾 Saved: {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if (baseline.get("options"), baseline.get("answer_words")) != (options, args.answer_words):
+            # Different output modes render different pages; the numbers wouldn't mean anything
+            print(f"\n💥 {args.compare} was recorded with options {baseline.get('options')} and "
+                  f"--answer-words {baseline.get('answer_words')}; rerun with the same ones to compare")
+            return 1
+        print(f"\n📊 Compared with {args.compare}:")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n💥 {len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,48 +1,245 @@
 """
 GitHub Copilot 300 Q&A Generator
-Generates comprehensive HTML files for remaining topics (5-11)
+Builds the Q&A site: the topic pages generated from content/, the hub,
+search index and other site files, next to the hand-written topic pages.
+Run with --help for the build options.
 """
 
 import os
+import sys
+import json
+import hashlib
+import argparse
+import textwrap
+import re
+import math
+import html
+import zlib
+import time
+import threading
+import gzip
+import shutil
+import tarfile
+import zipfile
+import subprocess
+import cProfile
+import struct
+import pstats
+from contextlib import ExitStack, contextmanager
+from functools import partial, lru_cache
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+from packed_corpus import PackedCorpus, pack_corpus
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz variants are written without it
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # not on Windows: build_lock falls back to an exclusive lock file
+    fcntl = None
 
 # Base directory - current directory since script is in GH_300Q&A folder
 OUTPUT_DIR = Path(".")
 
+# Where the generator lives; hand-written topic pages sit next to it
+SITE_DIR = Path(__file__).resolve().parent
+
+# Q&A content, one JSON Lines file per topic
+CONTENT_DIR = SITE_DIR / "content"
+
+# Packed copy of the content (see pack_corpus), preferred while it is up to date
+CORPUS_NAME = "corpus.qapk"
+
+# Content hashes of the last build, used by incremental builds
+MANIFEST_NAME = ".build-manifest.json"
+
+# Hashes and sizes of every file a deploy uploads, and what changed since the last build
+DEPLOY_MANIFEST_NAME = ".deploy-manifest.json"
+
+# Held for the whole of a build so builds sharing an output directory take turns
+BUILD_LOCK_NAME = ".build.lock"
+# Seconds after which a lock file left by a crashed build (fallback locking only) is broken
+BUILD_LOCK_STALE_SECONDS = 3600
+BUILD_LOCK_POLL_SECONDS = 0.1
+
+# Rendered Q&A fragments reused across builds, evicted least-recently-used
+FRAGMENT_CACHE_NAME = ".fragment-cache.json"
+FRAGMENT_CACHE_MAX_BYTES = 64 << 20
+
+# Generated files use the committed pages' CRLF line endings on every platform
+LINE_ENDING = "\r\n"
+
+# Pages are streamed to disk through a buffer of this size
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Suffixes of the precompressed variants written next to a file
+VARIANT_SUFFIXES = (".gz", ".br")
+
+# Precompressed variants are only kept when they pay off
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_MAX_RATIO = 0.9
+
+# Functions listed by --profile, by cumulative time
+PROFILE_TOP = 15
+
+# Question-level search index for the hub page
+SEARCH_INDEX_NAME = "search-index.json"
+SEARCH_SCRIPT_NAME = "search.js"
+QUESTION_WEIGHT = 3
+
+# Question anchors: id="q-<slug>-<hash>" on every .qa-item, and the table
+# mapping each anchor to its page and position
+ANCHOR_PREFIX = "q-"
+ANCHOR_SLUG_LENGTH = 48
+ANCHORS_NAME = "anchors.json"
+
 # Common CSS and structure
-def get_html_template(topic_num, title, subtitle, qa_count, prev_topic, next_topic):
+PAGE_CSS = """        * {margin: 0; padding: 0; box-sizing: border-box;}
+        body {font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; background: #f5f7fa; padding: 20px;}
+        .container {max-width: 1000px; margin: 0 auto; background: white; border-radius: 10px; box-shadow: 0 5px 20px rgba(0,0,0,0.1); overflow: hidden;}
+        header {background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px;}
+        header h1 {font-size: 2em; margin-bottom: 10px;}
+        .nav-links {padding: 15px 30px; background: #f8f9fa; border-bottom: 2px solid #e9ecef;}
+        .nav-links a {color: #667eea; text-decoration: none; margin-right: 20px; font-weight: 500;}
+        .nav-links a:hover {text-decoration: underline;}
+        .content {padding: 40px;}
+        .qa-item {margin-bottom: 30px; border-left: 4px solid #667eea; padding-left: 20px;}
+        .question {font-weight: 600; font-size: 1.1em; color: #2d3748; margin-bottom: 10px; cursor: pointer; display: flex; align-items: center; gap: 10px;}
+        .question::before {content: 'Q'; background: #667eea; color: white; width: 30px; height: 30px; border-radius: 50%; display: inline-flex; align-items: center; justify-content: center; font-weight: bold; flex-shrink: 0;}
+        .answer {margin-left: 40px; padding: 15px; background: #f8f9fa; border-radius: 8px; margin-top: 10px;}
+        .answer::before {content: 'A: '; font-weight: bold; color: #667eea;}
+        .answer ul, .answer ol {margin-left: 20px; margin-top: 10px;}
+        .answer li {margin-bottom: 5px;}
+        .code-block {background: #2d3748; color: #68d391; padding: 15px; border-radius: 5px; margin: 10px 0; overflow-x: auto; font-family: 'Courier New', monospace; font-size: 0.85em; line-height: 1.4;}
+        .highlight {background: #fef3c7; padding: 2px 6px; border-radius: 3px; font-weight: 500;}
+        .info-box {background: #dbeafe; border-left: 4px solid #3b82f6; padding: 15px; margin: 10px 0; border-radius: 5px;}
+        .warning-box {background: #fef3c7; border-left: 4px solid #f59e0b; padding: 15px; margin: 10px 0; border-radius: 5px;}
+        footer {background: #2d3748; color: white; text-align: center; padding: 20px;}
+        .pager {margin-bottom: 30px; color: #666;}
+        .pager a, .pager strong {margin: 0 4px;}
+        .pager a {color: #667eea;}
+
+        /* Mobile Responsive Styles */
+        @media (max-width: 768px) {
+            body {padding: 10px;}
+            header {padding: 20px 15px;}
+            header h1 {font-size: 1.6em;}
+            header p {font-size: 0.95em;}
+            .nav-links {padding: 10px 15px; flex-wrap: wrap;}
+            .nav-links a {margin-right: 10px; margin-bottom: 5px; font-size: 0.9em;}
+            .content {padding: 20px;}
+            .qa-item {padding-left: 10px; border-left-width: 3px;}
+            .question {font-size: 1em;}
+            .question::before {width: 25px; height: 25px; font-size: 0.9em;}
+            .answer {margin-left: 30px; padding: 12px; font-size: 0.95em;}
+            .code-block {font-size: 0.8em; padding: 12px; overflow-x: auto;}
+            footer {padding: 15px; font-size: 0.9em;}
+        }
+
+        @media (max-width: 480px) {
+            header h1 {font-size: 1.4em;}
+            .content {padding: 15px;}
+            .answer {margin-left: 20px; padding: 10px;}
+            .answer ul, .answer ol {margin-left: 15px;}
+        }
+
+        @media print {body {background: white;} .nav-links {display: none;} .qa-item {page-break-inside: avoid;}}
+"""
+
+PAGE_JS = """        // Shared answer fragments (data-include) are fetched once per page and swapped in
+        const includes = {};
+        function loadIncludes(root) {
+            root.querySelectorAll('[data-include]').forEach(function(slot) {
+                const src = slot.dataset.include;
+                includes[src] = includes[src] || fetch(src).then(function(response) {
+                    if (!response.ok) throw new Error(response.status + ' ' + response.statusText);
+                    return response.text();
+                });
+                includes[src].then(function(html) { slot.outerHTML = html; }, function() {
+                    // Offline, opened from file:// or gone: say so rather than leave a gap
+                    slot.className = 'warning-box';
+                    slot.textContent = 'This part of the answer could not be loaded. ';
+                    const link = document.createElement('a');
+                    link.href = src;
+                    link.textContent = 'Open it';
+                    slot.appendChild(link);
+                });
+            });
+        }
+        loadIncludes(document);
+
+        // One delegated listener for every question; lazily shipped answers
+        // (data-answer) are inflated from the #qa-answers block on first expand
+        let lazyAnswers = null;
+        function showAnswer(answer, show) {
+            if (answer.dataset.answer !== undefined) {
+                lazyAnswers = lazyAnswers || JSON.parse(document.getElementById('qa-answers').textContent);
+                answer.innerHTML = lazyAnswers[answer.dataset.answer];
+                delete answer.dataset.answer;
+                loadIncludes(answer);
+            }
+            answer.style.display = show ? 'block' : 'none';
+        }
+        document.addEventListener('click', function(event) {
+            const question = event.target.closest('.question');
+            if (!question) return;
+            const answer = question.nextElementSibling;
+            showAnswer(answer, answer.style.display === 'none');
+        });
+
+        // #q-... links open that question's answer; anchors that live on
+        // another page (e.g. after re-pagination) are found in """ + ANCHORS_NAME + """
+        function openAnchor() {
+            const id = decodeURIComponent(location.hash.slice(1));
+            const item = id && document.getElementById(id);
+            if (item) {
+                if (item.classList.contains('qa-item')) showAnswer(item.querySelector('.answer'), true);
+                item.scrollIntoView();
+            } else if (id.startsWith('""" + ANCHOR_PREFIX + """')) {
+                fetch('""" + ANCHORS_NAME + """').then(function(response) {
+                    return response.json();
+                }).then(function(table) {
+                    const hit = table.anchors[id];
+                    if (hit && table.pages[hit[0]] !== location.pathname.split('/').pop()) {
+                        location.replace(table.pages[hit[0]] + '#' + id);
+                    }
+                }).catch(function() {});
+            }
+        }
+        window.addEventListener('hashchange', openAnchor);
+        openAnchor();
+"""
+
+# Shared assets are written as copilot-qa.<hash>.css/.js in external-assets mode
+ASSET_PREFIX = "copilot-qa"
+
+SERVICE_WORKER_NAME = "sw.js"
+PRECACHE_NAME = "precache-manifest.json"
+
+SW_REGISTER_SCRIPT = """    <script>
+        if ('serviceWorker' in navigator) navigator.serviceWorker.register('""" + SERVICE_WORKER_NAME + """');
+    </script>
+"""
+
+def get_html_template(topic_num, title, subtitle, qa_count, prev_topic, next_topic, assets=None):
+    subtitle = subtitle.replace("{qa_count}", str(qa_count))
+    if assets:
+        style = f'    <link rel="stylesheet" href="{assets["css"]}">\n'
+    else:
+        style = f"    <style>\n{PAGE_CSS}    </style>\n"
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title} - GitHub Copilot Q&A</title>
-    <style>
-        * {{margin: 0; padding: 0; box-sizing: border-box;}}
-        body {{font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; background: #f5f7fa; padding: 20px;}}
-        .container {{max-width: 1000px; margin: 0 auto; background: white; border-radius: 10px; box-shadow: 0 5px 20px rgba(0,0,0,0.1); overflow: hidden;}}
-        header {{background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px;}}
-        header h1 {{font-size: 2em; margin-bottom: 10px;}}
-        .nav-links {{padding: 15px 30px; background: #f8f9fa; border-bottom: 2px solid #e9ecef;}}
-        .nav-links a {{color: #667eea; text-decoration: none; margin-right: 20px; font-weight: 500;}}
-        .nav-links a:hover {{text-decoration: underline;}}
-        .content {{padding: 40px;}}
-        .qa-item {{margin-bottom: 30px; border-left: 4px solid #667eea; padding-left: 20px;}}
-        .question {{font-weight: 600; font-size: 1.1em; color: #2d3748; margin-bottom: 10px; cursor: pointer; display: flex; align-items: center; gap: 10px;}}
-        .question::before {{content: 'Q'; background: #667eea; color: white; width: 30px; height: 30px; border-radius: 50%; display: inline-flex; align-items: center; justify-content: center; font-weight: bold; flex-shrink: 0;}}
-        .answer {{margin-left: 40px; padding: 15px; background: #f8f9fa; border-radius: 8px; margin-top: 10px;}}
-        .answer::before {{content: 'A: '; font-weight: bold; color: #667eea;}}
-        .answer ul, .answer ol {{margin-left: 20px; margin-top: 10px;}}
-        .answer li {{margin-bottom: 5px;}}
-        .code-block {{background: #2d3748; color: #68d391; padding: 15px; border-radius: 5px; margin: 10px 0; overflow-x: auto; font-family: 'Courier New', monospace; font-size: 0.85em; line-height: 1.4;}}
-        .highlight {{background: #fef3c7; padding: 2px 6px; border-radius: 3px; font-weight: 500;}}
-        .info-box {{background: #dbeafe; border-left: 4px solid #3b82f6; padding: 15px; margin: 10px 0; border-radius: 5px;}}
-        .warning-box {{background: #fef3c7; border-left: 4px solid #f59e0b; padding: 15px; margin: 10px 0; border-radius: 5px;}}
-        footer {{background: #2d3748; color: white; text-align: center; padding: 20px;}}
-        @media print {{body {{background: white;}} .nav-links {{display: none;}} .qa-item {{page-break-inside: avoid;}}}}
-    </style>
-</head>
+{style}</head>
 <body>
     <div class="container">
         <header>
@@ -59,27 +256,43 @@ def get_html_template(topic_num, title, subtitle, qa_count, prev_topic, next_top
         <div class="content">
 """
 
-def get_footer(topic_num):
+def get_footer(topic_num, assets=None, topic_count=11, offline=False):
+    if assets:
+        script = f'    <script src="{assets["js"]}"></script>\n'
+    else:
+        script = f"    <script>\n{PAGE_JS}    </script>\n"
+    if offline:
+        script += SW_REGISTER_SCRIPT
     return """        </div>
 
         <footer>
-            <p>GitHub Copilot Q&A - Topic {topic_num} of 11 | © 2025</p>
+            <p>GitHub Copilot Q&A - Topic {topic_num} of {topic_count} | © 2025</p>
         </footer>
     </div>
 
-    <script>
-        document.querySelectorAll('.question').forEach(question => {{
-            question.addEventListener('click', function() {{
-                const answer = this.nextElementSibling;
-                answer.style.display = answer.style.display === 'none' ? 'block' : 'none';
-            }});
-        }});
-    </script>
-</body>
-</html>""".format(topic_num=topic_num)
+{script}</body>
+</html>""".format(topic_num=topic_num, topic_count=topic_count, script=script)
+
+def question_anchor(question):
+    """Stable anchor ID for a question: a readable slug plus a hash of its text."""
+    text = html.unescape(TAG_RE.sub("", question)).strip()
+    slug = "-".join(SLUG_RE.findall(text.lower()))
+    if len(slug) > ANCHOR_SLUG_LENGTH:
+        slug = slug[:ANCHOR_SLUG_LENGTH + 1].rsplit("-", 1)[0]
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:6]
+    return f"{ANCHOR_PREFIX}{slug}-{digest}" if slug else f"{ANCHOR_PREFIX}{digest}"
 
-def qa_item(question, answer):
-    return f"""            <div class="qa-item">
+def qa_item(question, answer, lazy_index=None):
+    anchor = question_anchor(question)
+    if lazy_index is not None:
+        # Answer body ships in the page's #qa-answers data block instead
+        return f"""            <div class="qa-item" id="{anchor}">
+                <div class="question">{question}</div>
+                <div class="answer" data-answer="{lazy_index}" style="display: none"></div>
+            </div>
+
+"""
+    return f"""            <div class="qa-item" id="{anchor}">
                 <div class="question">{question}</div>
                 <div class="answer">
                     {answer}
@@ -88,565 +301,2226 @@ def qa_item(question, answer):
 
 """
 
-# Topic 5: CLI Commands & Limitations
+# Topic registry - every page on the site, in navigation order. Topics with a
+# "source" are generated from content files; the others are hand-written pages.
+TOPICS = [
+    {
+        "num": 1,
+        "filename": "01-audit-log-events.html",
+        "name": "Audit Log Events & Monitoring",
+        "description": "Learn about tracking GitHub Copilot usage, events, and monitoring capabilities",
+    },
+    {
+        "num": 2,
+        "filename": "02-business-vs-enterprise.html",
+        "name": "GHC Business vs Enterprise",
+        "description": "Compare features, capabilities, and differences between pricing tiers",
+    },
+    {
+        "num": 3,
+        "filename": "03-content-exclusions.html",
+        "name": "Content Exclusions & .copilotignore",
+        "description": "Master content filtering, exclusions, and privacy controls",
+    },
+    {
+        "num": 4,
+        "filename": "04-metrics-api.html",
+        "name": "Metrics API & REST API",
+        "description": "Explore API usage, endpoints, and integration patterns",
+    },
+    {
+        "num": 5,
+        "filename": "05-cli-commands.html",
+        "name": "GHC CLI Commands & Limitations",
+        "description": "Command-line interface usage, commands, and constraints",
+        "title": "🖥️ Topic 5: GHC CLI Commands & Limitations",
+        "subtitle": "{qa_count} Comprehensive Questions & Answers",
+        "source": "05-cli-commands.jsonl",
+    },
+    {
+        "num": 6,
+        "filename": "06-usage-analytics.html",
+        "name": "Usage Analytics & Metrics",
+        "description": "Understand metrics, analytics, and usage reporting",
+    },
+    {
+        "num": 7,
+        "filename": "07-effective-prompting.html",
+        "name": "Effective Prompting Practices",
+        "description": "Best practices for crafting effective prompts and getting better results",
+    },
+    {
+        "num": 8,
+        "filename": "08-responsible-ai.html",
+        "name": "Responsible AI Principles",
+        "description": "Fairness, reliability, privacy, security, and ethical AI usage",
+    },
+    {
+        "num": 9,
+        "filename": "09-sdlc-integration.html",
+        "name": "SDLC Integration with GHC",
+        "description": "Software development lifecycle integration and workflows",
+    },
+    {
+        "num": 10,
+        "filename": "10-security-privacy.html",
+        "name": "Security, Privacy & Data Handling",
+        "description": "Data protection, security features, and compliance",
+    },
+    {
+        "num": 11,
+        "filename": "11-plans-billing.html",
+        "name": "Plans, Billing & Licensing",
+        "description": "Pricing plans, billing cycles, and license management",
+    },
+]
+
+def is_generated(topic):
+    return "source" in topic or "qa" in topic
+
+def generated_topics():
+    return [topic for topic in TOPICS if is_generated(topic)]
+
+def topic_neighbours(topic):
+    """Previous and next page filenames, following registry order."""
+    for i, candidate in enumerate(TOPICS):
+        if candidate is topic:
+            prev_topic = TOPICS[i - 1]["filename"] if i > 0 else None
+            next_topic = TOPICS[i + 1]["filename"] if i + 1 < len(TOPICS) else None
+            return prev_topic, next_topic
+    return None, None
+
+def topic_header(topic, qa_count, assets=None):
+    prev_topic, next_topic = topic_neighbours(topic)
+    return get_html_template(topic["num"], topic["title"], topic["subtitle"], qa_count,
+                             prev_topic, next_topic, assets)
+
+def topic_footer(topic, assets=None, offline=False):
+    return get_footer(topic["num"], assets, len(TOPICS), offline)
+
+def page_filename(filename, page_num):
+    """Filename of page page_num of a topic; page 1 keeps the topic's own filename."""
+    if page_num == 1:
+        return filename
+    stem, dot, suffix = filename.rpartition(".")
+    return f"{stem}-{page_num}{dot}{suffix}"
+
+def paginate(topic, qa_list, per_page=None):
+    """Split a topic into [(filename, qa_slice), ...], one entry per page."""
+    if per_page is not None and per_page < 1:
+        raise ValueError(f"per_page must be at least 1, not {per_page}")
+    if not per_page or len(qa_list) <= per_page:
+        return [(topic["filename"], qa_list)]
+    return [(page_filename(topic["filename"], n), qa_list[start:start + per_page])
+            for n, start in enumerate(range(0, len(qa_list), per_page), 1)]
+
+def get_pager(filenames, current):
+    links = " ".join(f"<strong>{n}</strong>" if n == current else f'<a href="{filename}">{n}</a>'
+                     for n, filename in enumerate(filenames, 1))
+    return f"""            <div class="pager">Page {current} of {len(filenames)}: {links}</div>
+
+"""
+
+# File signatures
+def file_signature(path):
+    """(mtime, size) of a file, or None if it doesn't exist; changes whenever the file is rewritten."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def cached_by_signature(cache, path, load):
+    """Return load(path), reusing the result kept in cache until the file's signature changes."""
+    signature = file_signature(path)
+    cached = cache.get(path)
+    if not cached or cached[0] != signature:
+        cached = (signature, load(path))
+        cache[path] = cached
+    return cached[1]
+
+def write_corpus(content_dir=CONTENT_DIR):
+    """Pack every generated topic's JSON Lines content into content_dir / CORPUS_NAME (see packed_corpus)."""
+    topics = []
+    for topic in generated_topics():
+        if "source" not in topic:
+            continue
+        signature = file_signature(content_dir / topic["source"])
+        topics.append((topic["num"], signature, load_qa(topic, packed=False)))
+    path = content_dir / CORPUS_NAME
+    tmp = temp_path(path)
+    with open(tmp, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        pack_corpus(f, topics)
+        fsync_file(f)
+    changed = replace_if_changed(tmp, path, file_hash(tmp), tmp.stat().st_size)
+    items = sum(len(qa_list) for _, _, qa_list in topics)
+    print(f"{'✅ Created' if changed else '⏭️  Unchanged'}: {path.name} "
+          f"({len(topics)} topic(s), {items} Q&A, {path.stat().st_size:,} B)")
+
+# Open packed corpora by path (see cached_by_signature)
+_corpus_cache = {}
+
+def get_corpus(path):
+    """The PackedCorpus at path, or None if there is no usable one; reopened when the file changes.
+
+    The pack is only a cache of the JSON Lines files, so an empty, truncated
+    or foreign file is reported once and then ignored.
+    """
+    if not path.exists():
+        return None
+    return cached_by_signature(_corpus_cache, path, open_corpus)
+
+def open_corpus(path):
+    try:
+        # The old map stays valid for readers still holding it, even once the file is replaced
+        return PackedCorpus(path)
+    except (OSError, ValueError, struct.error) as exc:
+        print(f"⚠️  Ignoring unreadable packed corpus {path.name} ({exc}); reading the JSON Lines files")
+        return None
+
+# Parsed Q&A lists by source path (see cached_by_signature)
+_qa_cache = {}
+
+def load_qa(topic, packed=True):
+    """Return the (question, answer) list for a topic, loading it on first use.
+
+    Topics normally name a JSON Lines file in CONTENT_DIR with one
+    {"question": ..., "answer": ...} object per line. Entries may instead
+    provide a "qa" callable, which is called every time. Parsed files are
+    cached per process and re-read only when they change on disk.
+
+    If CONTENT_DIR holds a packed corpus (see write_corpus) whose section
+    for the topic was packed from the current file, or the file is gone,
+    a memory-mapped PackedTopic is returned instead of parsing the file.
+    """
+    if "qa" in topic:
+        return topic["qa"]()
+    path = CONTENT_DIR / topic["source"]
+    signature = file_signature(path)
+    corpus = get_corpus(CONTENT_DIR / CORPUS_NAME) if packed else None
+    if corpus and topic["num"] in corpus.topics and signature in (None, corpus.source_signature(topic["num"])):
+        return corpus.topic(topic["num"])
+    if signature is None:
+        raise FileNotFoundError(f"{path}: no such content file or packed corpus section")
+    return cached_by_signature(_qa_cache, path, read_qa_file)
+
+def read_qa_file(path):
+    """Parse a JSON Lines content file into a list of (question, answer) pairs."""
+    qa_list = []
+    with open(path, encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                qa_list.append((item["question"], item["answer"]))
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"{path}:{line_num}: invalid Q&A entry ({exc})") from None
+    return qa_list
+
+def source_signatures():
+    """(mtime, size) of every topic's content file, keyed by topic number."""
+    return {topic["num"]: file_signature(CONTENT_DIR / topic["source"])
+            for topic in generated_topics() if "source" in topic}
+
+def get_topic(topic_num):
+    for topic in TOPICS:
+        if topic["num"] == topic_num:
+            return topic
+    raise KeyError(f"Unknown topic: {topic_num}")
+
+def iter_topic(topic, qa_list, options=None, stats=None, page=None):
+    """Yield a topic page chunk by chunk: header, one chunk per Q&A, footer.
+
+    page is a (page number, page filenames, topic question count) tuple when
+    the topic is split over several pages; qa_list then holds just this
+    page's questions. options are the build settings (see
+    generate_all_topics); "includes" maps shared answer fragments to the
+    include files that replace them (see find_shared_fragments). With
+    "minify", each chunk is minified and, if a stats dict is given, the
+    unminified size is added up in stats["raw_size"]. With
+    "fragment_cache", finished Q&A fragments come from that cache file
+    when their question, answer and markup are unchanged.
+    """
+    options = options or {}
+    stats = stats if stats is not None else {}
+    assets = options.get("assets")
+    lazy = options.get("lazy_answers")
+    minify = options.get("minify")
+    cache = get_fragment_cache(options["fragment_cache"]) if options.get("fragment_cache") else None
+    includes = options.get("includes")
+    if minify:
+        stats.setdefault("raw_size", 0)
+
+    def finish(chunk):
+        if not minify:
+            return chunk
+        stats["raw_size"] += len(encode_page(chunk))
+        return minify_html(chunk)
+
+    yield finish(topic_header(topic, page[2] if page else len(qa_list), assets))
+    pager = get_pager(page[1], page[0]) if page and len(page[1]) > 1 else ""
+    if pager:
+        yield finish(pager)
+    for i, (q, a) in enumerate(with_includes(qa_list, includes)):
+        index = i if lazy else None
+        if cache is None:
+            yield finish(qa_item(q, a, index))
+            continue
+        key = fragment_key(q, a, index, minify)
+        fragment = cache.get(key)
+        if fragment is None:
+            raw = qa_item(q, a, index)
+            fragment = [minify_html(raw) if minify else raw, len(encode_page(raw))]
+            cache.put(key, fragment)
+        if minify:
+            stats["raw_size"] += fragment[1]
+        yield fragment[0]
+    if pager:
+        yield finish(pager)
+    if lazy:
+        yield finish(lazy_answers_block(with_includes(qa_list, includes), minify))
+    yield finish(topic_footer(topic, assets, options.get("offline")))
+
+def with_includes(qa_list, includes):
+    """Iterate over qa_list with shared fragments replaced one answer at a time (see apply_includes)."""
+    if not includes:
+        return iter(qa_list)
+    return ((q, apply_includes(a, includes)) for q, a in qa_list)
+
+def lazy_answers_block(qa_list, minify=False):
+    """Embed every answer as a JSON array the page script inflates on demand."""
+    answers = [minify_html(a).strip() if minify else a for _, a in qa_list]
+    # "</" would end the script element early
+    data = json.dumps(answers, ensure_ascii=False).replace("</", "<\\/")
+    return f'            <script type="application/json" id="qa-answers">{data}</script>\n'
+
+def iter_topic_pages(topic, qa_list, options=None, stats=None):
+    """Yield (filename, page Q&A, chunk iterator) for each page of a topic (see paginate)."""
+    pages = paginate(topic, qa_list, (options or {}).get("per_page"))
+    filenames = [filename for filename, _ in pages]
+    for page_num, (filename, page_qa) in enumerate(pages, 1):
+        yield filename, page_qa, iter_topic(topic, page_qa, options, stats, (page_num, filenames, len(qa_list)))
+
+def render_topic(topic, qa_list, options=None):
+    return "".join(iter_topic(topic, qa_list, options))
+
+# HTML minification
+# Whitespace inside these elements is significant (or at least not ours to touch)
+PRESERVE_RE = re.compile(
+    r'(<(pre|textarea|script)\b.*?</\2>|<div class="code-block">.*?</div>)',
+    re.DOTALL | re.IGNORECASE)
+# Line breaks with their indentation, then leftover runs of spaces. Only
+# ASCII whitespace is touched so &nbsp; characters survive; each pattern
+# starts with a literal so the scan stays fast on large pages.
+LINE_BREAK_RE = re.compile(r"\n[ \t\r\n\f]*")
+SPACE_RUN_RE = re.compile(r" [ \t\r\f]+")
+# Whitespace next to block-level tags never renders, so it can be dropped
+BLOCK_TAGS = (r"(?:!DOCTYPE|/?(?:html|head|body|meta|title|style|link|script|div|header|footer"
+              r"|nav|section|ul|ol|li|p|h[1-6]|br)\b)")
+SPACE_BEFORE_BLOCK_RE = re.compile(r" (?=<" + BLOCK_TAGS + ")", re.IGNORECASE)
+SPACE_AFTER_BLOCK_RE = re.compile(r"(<" + BLOCK_TAGS + r"[^>]*>) ", re.IGNORECASE)
+
+def collapse_whitespace(text):
+    text = SPACE_RUN_RE.sub(" ", LINE_BREAK_RE.sub(" ", text))
+    return SPACE_AFTER_BLOCK_RE.sub(r"\1", SPACE_BEFORE_BLOCK_RE.sub("", text))
+
+def minify_html(text):
+    """Collapse insignificant whitespace in an HTML fragment.
+
+    Runs of whitespace become a single space, and spaces next to block-level
+    tags are removed. <pre>, <textarea>, <script> and code-block contents
+    are left exactly as they are.
+    """
+    parts = PRESERVE_RE.split(text)
+    out = []
+    # split() yields: text, preserved block, tag name (None for code-block), text, ...
+    for i in range(0, len(parts), 3):
+        chunk = collapse_whitespace(parts[i])
+        # Apart from <textarea>, the preserved elements are block-level too
+        if i > 0 and (parts[i - 1] or "").lower() != "textarea":
+            chunk = chunk.lstrip(" ")
+        if i + 1 < len(parts) and (parts[i + 2] or "").lower() != "textarea":
+            chunk = chunk.rstrip(" ")
+        out.append(chunk)
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return "".join(out)
+
+# Fragment cache
+@lru_cache(maxsize=None)
+def fragment_version():
+    """Fingerprint of the qa_item/minify markup; changing either invalidates cached fragments."""
+    sample = qa_item("\0q", "\0a") + qa_item("\0q", "\0a", 0)
+    return hashlib.sha256((sample + minify_html(sample)).encode("utf-8")).hexdigest()
+
+def fragment_key(question, answer, lazy_index, minify):
+    data = json.dumps([fragment_version(), question, answer, lazy_index, bool(minify)],
+                      ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+class FragmentCache:
+    """Size-bounded LRU cache of rendered qa_item fragments, persisted as JSON.
+
+    Values are [fragment, unminified size]. Entries used or added since the
+    last drain() are tracked so a worker process can hand them back to the
+    parent, which owns the file.
+    """
+
+    def __init__(self, path, max_bytes=FRAGMENT_CACHE_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.touched = []
+        self.added = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == fragment_version():
+                for key, fragment, raw_size in data["entries"]:
+                    self.entries[key] = [fragment, raw_size]
+                    self.size += len(fragment)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.entries.clear()
+            self.size = 0
+
+    def get(self, key):
+        fragment = self.entries.get(key)
+        if fragment is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        self.touched.append(key)
+        return fragment
+
+    def put(self, key, fragment):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = fragment
+        self.size += len(fragment[0])
+        self.added[key] = fragment
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted[0])
+
+    def drain(self):
+        """Return and reset the (hits, misses, touched, added) recorded so far."""
+        delta = (self.hits, self.misses, self.touched, self.added)
+        self.hits = self.misses = 0
+        self.touched = []
+        self.added = {}
+        return delta
+
+    def merge(self, touched, added):
+        for key in touched:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+        for key, fragment in added.items():
+            self.put(key, fragment)
+
+    def save(self):
+        data = {
+            "version": fragment_version(),
+            "entries": [[key, fragment, raw_size] for key, (fragment, raw_size) in self.entries.items()],
+        }
+        write_if_changed(self.path, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+# One cache per file per process, loaded on first use
+_fragment_caches = {}
+
+def get_fragment_cache(path):
+    path = Path(path)
+    if path not in _fragment_caches:
+        _fragment_caches[path] = FragmentCache(path)
+    return _fragment_caches[path]
+
+# Shared answer fragments
+# Block-level snippets that answers repeat verbatim: code blocks, notes and lists
+SHARED_FRAGMENT_RE = re.compile(
+    r'<div class="(?:code-block|info-box|warning-box)">.*?</div>|<(ul|ol)>.*?</\1>', re.DOTALL)
+# Smaller fragments aren't worth a request of their own
+SHARED_FRAGMENT_MIN_SIZE = 256
+INCLUDE_PREFIX = "qa-fragment"
+
+def include_slot(name):
+    return f'<div data-include="{name}"></div>'
+
+def find_shared_fragments(answers, min_size=SHARED_FRAGMENT_MIN_SIZE):
+    """Find fragments repeated across answers; returns {fragment: include filename}.
+
+    Include files are named after a hash of their content, so every page
+    that references one shares a single immutable, cacheable copy.
+    """
+    return shared_fragments(count_fragments(answers, min_size))
+
+def count_fragments(answers, min_size=SHARED_FRAGMENT_MIN_SIZE):
+    """Occurrences of each candidate fragment; answers may be any iterable, read once."""
+    counts = {}
+    for answer in answers:
+        for match in SHARED_FRAGMENT_RE.finditer(answer):
+            fragment = match.group(0)
+            tag = match.group(1) or "div"
+            # The non-greedy match stops at the first closing tag, so nested lists/divs are skipped
+            if len(fragment) >= min_size and fragment.count(f"<{tag}") == fragment.count(f"</{tag}>"):
+                counts[fragment] = counts.get(fragment, 0) + 1
+    return counts
+
+def shared_fragments(counts):
+    return {fragment: f"{INCLUDE_PREFIX}.{hashlib.sha256(fragment.encode('utf-8')).hexdigest()[:12]}.html"
+            for fragment, count in sorted(counts.items()) if count > 1}
+
+def apply_includes(answer, includes):
+    """Replace shared fragments in an answer with placeholders the page script fills in."""
+    return SHARED_FRAGMENT_RE.sub(lambda m: include_slot(includes[m.group(0)]) if m.group(0) in includes
+                                  else m.group(0), answer)
+
+def write_includes(output_dir, answers, minify=False):
+    """Write an include file per shared fragment and drop includes no longer used.
+
+    answers may be any iterable of answers, e.g. a generator over packed topics.
+
+    Returns (includes, report) where report counts the fragments, their
+    references and the bytes saved in the pages, net of the include files.
+    """
+    counts = count_fragments(answers)
+    includes = shared_fragments(counts)
+    references = sum(counts[fragment] for fragment in includes)
+    saved = sum(counts[fragment] * (len(fragment.encode("utf-8")) - len(include_slot(name)))
+                for fragment, name in includes.items())
+    stored = 0
+    for fragment, name in includes.items():
+        data = encode_page(minify_html(fragment).strip() if minify else fragment)
+        stored += len(data)
+        if write_if_changed(output_dir / name, data):
+            print(f"✅ Created: {name}")
+    for path in output_dir.glob(f"{INCLUDE_PREFIX}.*.html"):
+        if path.name not in includes.values():
+            path.unlink()
+    return includes, {"fragments": len(includes), "references": references,
+                      "saved_bytes": saved, "net_saved_bytes": saved - stored}
+
+def write_shared_assets(output_dir, compress=False):
+    """Write the page CSS/JS once as content-fingerprinted files and drop older ones.
+
+    Returns the asset names to link from every page, e.g.
+    {"css": "copilot-qa.1a2b3c4d5e.css", "js": "copilot-qa.6f7a8b9c0d.js"}.
+    """
+    assets = {}
+    for kind, name, data in shared_assets():
+        write_site_file(output_dir, name, data, compress)
+        assets[kind] = name
+    remove_unused_assets(output_dir, assets.values())
+    return assets
+
+def remove_unused_assets(output_dir, keep=()):
+    """Delete fingerprinted CSS/JS files (and their variants) other than keep."""
+    keep = {name + suffix for name in keep for suffix in ("",) + VARIANT_SUFFIXES}
+    for kind in ("css", "js"):
+        for path in output_dir.glob(f"{ASSET_PREFIX}.*.{kind}*"):
+            if path.name not in keep:
+                path.unlink()
+
+def shared_assets():
+    """The page CSS/JS as (kind, fingerprinted filename, bytes) triples."""
+    for kind, source in (("css", PAGE_CSS), ("js", PAGE_JS)):
+        data = encode_page(textwrap.dedent(source))
+        yield kind, f"{ASSET_PREFIX}.{hashlib.sha256(data).hexdigest()[:10]}.{kind}", data
+
 def generate_topic_05():
-    qa_list = [
-        ("What is the GitHub Copilot CLI?", """
-                    The GitHub Copilot CLI (Command Line Interface) is an extension for the GitHub CLI (gh) that brings AI assistance to your terminal. It provides:
-                    <ul>
-                        <li><strong>Natural language to command:</strong> Convert plain English to shell commands</li>
-                        <li><strong>Git command help:</strong> Assistance with complex git operations</li>
-                        <li><strong>Command explanation:</strong> Understand what commands do</li>
-                        <li><strong>Script generation:</strong> Create shell scripts from descriptions</li>
-                    </ul>
-                    <strong>Availability:</strong> GitHub Copilot Individual and Enterprise (limited in Business)
-        """),
-        
-        ("How do you install the GitHub Copilot CLI extension?", """
-                    <strong>Installation steps:</strong>
-                    <ol>
-                        <li><strong>Install GitHub CLI:</strong> Download from https://cli.github.com</li>
-                        <li><strong>Authenticate:</strong> <code>gh auth login</code></li>
-                        <li><strong>Install Copilot extension:</strong>
-                            <div class="code-block">gh extension install github/gh-copilot</div>
-                        </li>
-                        <li><strong>Verify installation:</strong>
-                            <div class="code-block">gh copilot --version</div>
-                        </li>
-                    </ol>
-                    <strong>Requirements:</strong>
-                    <ul>
-                        <li>GitHub CLI v2.0.0 or later</li>
-                        <li>Active GitHub Copilot subscription</li>
-                        <li>Authenticated GitHub account</li>
-                    </ul>
-        """),
-        
-        ("What are the main GitHub Copilot CLI commands?", """
-                    <strong>Core commands:</strong>
-                    <div class="code-block">
-# Suggest shell commands<br>
-gh copilot suggest "list all files modified in last 7 days"<br>
-<br>
-# Explain commands<br>
-gh copilot explain "tar -xzf file.tar.gz"<br>
-<br>
-# Interactive mode<br>
-gh copilot<br>
-<br>
-# Get help<br>
-gh copilot --help
-                    </div>
-                    <strong>Aliases (shorter commands):</strong>
-                    <div class="code-block">
-ghcs "your query"  # suggest<br>
-ghce "command"     # explain
-                    </div>
-        """),
-        
-        ("How does 'gh copilot suggest' work?", """
-                    <code>gh copilot suggest</code> converts natural language descriptions into executable shell commands.
-                    <br><br>
-                    <strong>Examples:</strong>
-                    <div class="code-block">
-# Find large files<br>
-$ gh copilot suggest "find files larger than 100MB"<br>
-→ find . -type f -size +100M<br>
-<br>
-# Process management<br>
-$ gh copilot suggest "kill all node processes"<br>
-→ pkill -9 node<br>
-<br>
-# Git operations<br>
-$ gh copilot suggest "undo last commit but keep changes"<br>
-→ git reset --soft HEAD~1
-                    </div>
-                    <strong>Features:</strong>
-                    <ul>
-                        <li>Multiple suggestions provided</li>
-                        <li>Interactive selection</li>
-                        <li>Direct execution option</li>
-                        <li>Explanation of suggested commands</li>
-                    </ul>
-        """),
-        
-        ("How does 'gh copilot explain' work?", """
-                    <code>gh copilot explain</code> provides detailed explanations of shell commands and their options.
-                    <br><br>
-                    <strong>Example:</strong>
-                    <div class="code-block">
-$ gh copilot explain "docker run -d -p 8080:80 nginx"<br>
-<br>
-Explanation:<br>
-- docker run: Create and start a container<br>
-- -d: Run container in detached mode (background)<br>
-- -p 8080:80: Map port 8080 on host to port 80 in container<br>
-- nginx: Use nginx image from Docker Hub
-                    </div>
-                    <strong>Use cases:</strong>
-                    <ul>
-                        <li>Learning new commands</li>
-                        <li>Understanding legacy scripts</li>
-                        <li>Security review of commands before execution</li>
-                        <li>Documentation for team members</li>
-                    </ul>
-        """),
-        
-        ("What types of commands can GitHub Copilot CLI generate?", """
-                    <strong>Supported command categories:</strong>
-                    <ul>
-                        <li><strong>Shell/Bash:</strong> File operations, text processing, system admin</li>
-                        <li><strong>Git:</strong> Version control, branching, merging, rebasing</li>
-                        <li><strong>Docker:</strong> Container management, image operations</li>
-                        <li><strong>Package managers:</strong> npm, pip, apt, brew commands</li>
-                        <li><strong>System administration:</strong> User management, permissions, processes</li>
-                        <li><strong>Network:</strong> curl, wget, ssh, scp operations</li>
-                        <li><strong>Data processing:</strong> awk, sed, grep, jq</li>
-                    </ul>
-                    <strong>Platform support:</strong> Linux, macOS, Windows (PowerShell/WSL)
-        """),
-        
-        ("What are the limitations of GitHub Copilot CLI?", """
-                    <strong>Current limitations:</strong>
-                    <ul>
-                        <li><strong>Context awareness:</strong> Limited understanding of your specific environment</li>
-                        <li><strong>Custom aliases:</strong> Doesn't know your personal shell aliases</li>
-                        <li><strong>Complex workflows:</strong> May struggle with multi-step operations</li>
-                        <li><strong>Platform differences:</strong> Commands may need adjustment between OS</li>
-                        <li><strong>Security:</strong> Cannot verify if suggested commands are safe for your system</li>
-                        <li><strong>API-dependent:</strong> Requires internet connection</li>
-                        <li><strong>No execution validation:</strong> Doesn't check if files/paths exist</li>
-                    </ul>
-                    <div class="warning-box">
-                        <strong>⚠️ Always review commands before execution, especially those that modify system state or data.</strong>
-                    </div>
-        """),
-        
-        ("Can GitHub Copilot CLI access your file system?", """
-                    <strong>No</strong>, GitHub Copilot CLI has <strong>limited local context:</strong>
-                    <ul>
-                        <li>❌ Cannot read your files or directories</li>
-                        <li>❌ Doesn't know your current directory structure</li>
-                        <li>❌ Cannot verify file existence before suggesting commands</li>
-                        <li>✅ Uses only the text you provide in queries</li>
-                    </ul>
-                    <strong>Implication:</strong> You need to provide context in your queries:
-                    <div class="code-block">
-# Less specific (may get generic answer)<br>
-gh copilot suggest "compile the code"<br>
-<br>
-# More specific (better results)<br>
-gh copilot suggest "compile Java code in src/ to build/ using Maven"
-                    </div>
-        """),
-        
-        ("How do you use GitHub Copilot CLI in scripts?", """
-                    <strong>Scripting approaches:</strong>
-                    <br><br>
-                    <strong>1. Generate commands non-interactively:</strong>
-                    <div class="code-block">
-# Get suggestion without interactive prompt<br>
-gh copilot suggest --non-interactive "compress all log files"
-                    </div>
-                    <strong>2. Pipe to shell execution (use with caution):</strong>
-                    <div class="code-block">
-# NOT RECOMMENDED - executes without review<br>
-gh copilot suggest "clean temp files" | sh
-                    </div>
-                    <strong>3. Better approach - save and review:</strong>
-                    <div class="code-block">
-gh copilot suggest "backup database" > backup_cmd.sh<br>
-cat backup_cmd.sh  # Review<br>
-sh backup_cmd.sh   # Execute after review
-                    </div>
-                    <div class="warning-box">
-                        <strong>Security Warning:</strong> Never blindly execute AI-generated commands in production scripts.
-                    </div>
-        """),
-        
-        ("What shell environments does GitHub Copilot CLI support?", """
-                    <strong>Supported shells:</strong>
-                    <ul>
-                        <li>✅ <strong>Bash</strong> (Linux, macOS, WSL)</li>
-                        <li>✅ <strong>Zsh</strong> (macOS default, Linux)</li>
-                        <li>✅ <strong>PowerShell</strong> (Windows, cross-platform)</li>
-                        <li>✅ <strong>Fish</strong></li>
-                        <li>⚠️ <strong>Cmd.exe</strong> (limited support)</li>
-                    </ul>
-                    <strong>Configuration:</strong> Copilot CLI adapts suggestions based on detected shell, but you can specify:
-                    <div class="code-block">
-gh copilot suggest --shell bash "find duplicate files"<br>
-gh copilot suggest --shell powershell "list running services"
-                    </div>
-        """),
-        
-        ("Can GitHub Copilot CLI generate multi-line scripts?", """
-                    <strong>Yes</strong>, but with varying complexity:
-                    <br><br>
-                    <strong>Simple scripts work well:</strong>
-                    <div class="code-block">
-$ gh copilot suggest "create script to backup and compress logs"<br>
-<br>
-#!/bin/bash<br>
-DATE=$(date +%Y%m%d)<br>
-tar -czf logs_backup_$DATE.tar.gz /var/log/<br>
-mv logs_backup_$DATE.tar.gz /backups/
-                    </div>
-                    <strong>Complex scripts may need iteration:</strong>
-                    <ul>
-                        <li>Break complex tasks into smaller queries</li>
-                        <li>Generate sections separately</li>
-                        <li>Combine and refine manually</li>
-                    </ul>
-                    <strong>Tip:</strong> For complex automation, IDE Copilot (in VS Code) is better suited than CLI.
-        """),
-        
-        ("How does GitHub Copilot CLI handle errors in suggested commands?", """
-                    <strong>Error handling capabilities:</strong>
-                    <ul>
-                        <li><strong>Syntax checking:</strong> Suggests syntactically valid commands</li>
-                        <li><strong>No runtime validation:</strong> Cannot predict execution errors</li>
-                        <li><strong>No rollback:</strong> Cannot undo executed commands</li>
-                        <li><strong>Learning:</strong> Can refine suggestions if you provide feedback</li>
-                    </ul>
-                    <strong>Best practices:</strong>
-                    <ol>
-                        <li>Test commands in safe environment first</li>
-                        <li>Use <code>--dry-run</code> flags when available</li>
-                        <li>Review explanations before execution</li>
-                        <li>Keep backups for destructive operations</li>
-                    </ol>
-        """),
-        
-        ("Can you use GitHub Copilot CLI offline?", """
-                    <strong>No</strong>, GitHub Copilot CLI requires:
-                    <ul>
-                        <li>❌ Active internet connection</li>
-                        <li>❌ GitHub API access</li>
-                        <li>❌ Valid authentication token</li>
-                    </ul>
-                    <strong>Why:</strong>
-                    <ul>
-                        <li>Commands are generated by cloud-based AI models</li>
-                        <li>No local model available</li>
-                        <li>Requires real-time API communication</li>
-                    </ul>
-                    <strong>Alternative:</strong> For offline command help, use:
-                    <ul>
-                        <li><code>man</code> pages</li>
-                        <li><code>--help</code> flags</li>
-                        <li><code>tldr</code> (simplified man pages)</li>
-                    </ul>
-        """),
-        
-        ("How do you customize GitHub Copilot CLI behavior?", """
-                    <strong>Configuration options:</strong>
-                    <div class="code-block">
-# Set default shell<br>
-gh copilot config set shell bash<br>
-<br>
-# Set interaction mode<br>
-gh copilot config set mode interactive<br>
-<br>
-# View current config<br>
-gh copilot config list
-                    </div>
-                    <strong>Environment variables:</strong>
-                    <div class="code-block">
-# Adjust verbosity<br>
-export GH_COPILOT_VERBOSE=1<br>
-<br>
-# Set timeout<br>
-export GH_COPILOT_TIMEOUT=30
-                    </div>
-                    <strong>Limitations:</strong> Cannot train on your specific command patterns or create custom command libraries.
-        """),
-        
-        ("What is the difference between GitHub Copilot CLI and IDE Copilot?", """
-                    <strong>GitHub Copilot CLI:</strong>
-                    <ul>
-                        <li>Terminal/command-line focused</li>
-                        <li>Shell command generation and explanation</li>
-                        <li>System administration tasks</li>
-                        <li>Git command assistance</li>
-                        <li>Quick one-off commands</li>
-                    </ul>
-                    <strong>IDE Copilot (VS Code, etc.):</strong>
-                    <ul>
-                        <li>Code editor integration</li>
-                        <li>Programming language code generation</li>
-                        <li>Multi-file context awareness</li>
-                        <li>Inline code completion</li>
-                        <li>Complex application development</li>
-                    </ul>
-                    <strong>Complementary:</strong> Use both together - IDE for development, CLI for operations.
-        """),
-        
-        ("Can GitHub Copilot CLI help with Git operations?", """
-                    <strong>Yes!</strong> Git is a primary use case:
-                    <br><br>
-                    <strong>Common Git queries:</strong>
-                    <div class="code-block">
-gh copilot suggest "undo last commit keeping changes"<br>
-→ git reset --soft HEAD~1<br>
-<br>
-gh copilot suggest "delete remote branch"<br>
-→ git push origin --delete branch-name<br>
-<br>
-gh copilot suggest "show files changed in last commit"<br>
-→ git diff --name-only HEAD~1 HEAD<br>
-<br>
-gh copilot suggest "interactive rebase last 5 commits"<br>
-→ git rebase -i HEAD~5<br>
-<br>
-gh copilot suggest "cherry pick commit from another branch"<br>
-→ git cherry-pick &lt;commit-hash&gt;
-                    </div>
-                    <strong>Especially useful for:</strong>
-                    <ul>
-                        <li>Complex rebase operations</li>
-                        <li>Submodule management</li>
-                        <li>Advanced git log queries</li>
-                        <li>Git configuration</li>
-                    </ul>
-        """),
-        
-        ("How does GitHub Copilot CLI handle dangerous commands?", """
-                    <strong>Safety measures:</strong>
-                    <ul>
-                        <li><strong>Warning display:</strong> Shows command before execution</li>
-                        <li><strong>Confirmation prompt:</strong> Asks "Execute this command?"</li>
-                        <li><strong>Explanation available:</strong> Review what command does</li>
-                    </ul>
-                    <div class="warning-box">
-                        <strong>⚠️ No automatic blocking:</strong> Copilot CLI will suggest potentially destructive commands if requested. Examples:
-                        <ul>
-                            <li><code>rm -rf /</code> - Deletes all files</li>
-                            <li><code>dd if=/dev/zero of=/dev/sda</code> - Wipes disk</li>
-                            <li><code>:(){ :|:& };:</code> - Fork bomb</li>
-                        </ul>
-                    </div>
-                    <strong>Your responsibility:</strong>
-                    <ul>
-                        <li>Understand commands before executing</li>
-                        <li>Test in safe environments</li>
-                        <li>Use <code>gh copilot explain</code> first</li>
-                        <li>Never blindly copy-paste</li>
-                    </ul>
-        """),
-        
-        ("Can GitHub Copilot CLI learn from your command history?", """
-                    <strong>No</strong>, Copilot CLI does not:
-                    <ul>
-                        <li>❌ Access your shell history</li>
-                        <li>❌ Learn from your past commands</li>
-                        <li>❌ Customize to your patterns</li>
-                        <li>❌ Remember previous interactions</li>
-                    </ul>
-                    <strong>Each query is stateless:</strong> Every suggestion is generated independently without context from previous sessions.
-                    <br><br>
-                    <strong>Workaround:</strong> Provide context in your queries:
-                    <div class="code-block">
-# Less helpful<br>
-gh copilot suggest "do the usual deployment"<br>
-<br>
-# More helpful<br>
-gh copilot suggest "deploy Node.js app to AWS using Docker and update ECS service"
-                    </div>
-        """),
-        
-        ("What are best practices for using GitHub Copilot CLI?", """
-                    <strong>Query formulation:</strong>
-                    <ul>
-                        <li>✅ Be specific: Include tool names, paths, formats</li>
-                        <li>✅ Provide context: Mention OS, environment, constraints</li>
-                        <li>✅ State goal clearly: What you want to achieve</li>
-                        <li>❌ Avoid vague queries: "fix it", "make it work"</li>
-                    </ul>
-                    <strong>Safety:</strong>
-                    <ul>
-                        <li>✅ Always review commands before execution</li>
-                        <li>✅ Test in non-production first</li>
-                        <li>✅ Use <code>explain</code> for unfamiliar commands</li>
-                        <li>✅ Keep backups before destructive operations</li>
-                    </ul>
-                    <strong>Efficiency:</strong>
-                    <ul>
-                        <li>✅ Set up shell aliases for frequent use</li>
-                        <li>✅ Save useful generated commands for reuse</li>
-                        <li>✅ Combine with traditional tools (man, tldr)</li>
-                    </ul>
-        """),
-        
-        ("How do you troubleshoot GitHub Copilot CLI issues?", """
-                    <strong>Common issues and solutions:</strong>
-                    <br><br>
-                    <strong>1. Authentication errors:</strong>
-                    <div class="code-block">
-gh auth status<br>
-gh auth refresh
-                    </div>
-                    <strong>2. Extension not found:</strong>
-                    <div class="code-block">
-gh extension list<br>
-gh extension install github/gh-copilot
-                    </div>
-                    <strong>3. Outdated version:</strong>
-                    <div class="code-block">
-gh extension upgrade gh-copilot<br>
-gh upgrade  # Update GitHub CLI itself
-                    </div>
-                    <strong>4. Network issues:</strong>
-                    <ul>
-                        <li>Check internet connection</li>
-                        <li>Verify GitHub API access (firewall/proxy)</li>
-                        <li>Test: <code>curl https://api.github.com</code></li>
-                    </ul>
-                    <strong>5. Subscription issues:</strong>
-                    <ul>
-                        <li>Verify Copilot license is active</li>
-                        <li>Check organization settings</li>
-                        <li>Ensure user has seat assigned</li>
-                    </ul>
-        """),
-        
-        ("Can GitHub Copilot CLI generate PowerShell commands?", """
-                    <strong>Yes!</strong> Full PowerShell support:
-                    <br><br>
-                    <strong>Example queries:</strong>
-                    <div class="code-block">
-gh copilot suggest --shell powershell "list all services starting with 'SQL'"<br>
-→ Get-Service | Where-Object {$_.Name -like "SQL*"}<br>
-<br>
-gh copilot suggest --shell powershell "get files modified in last 24 hours"<br>
-→ Get-ChildItem -Recurse | Where-Object {$_.LastWriteTime -gt (Get-Date).AddDays(-1)}<br>
-<br>
-gh copilot suggest --shell powershell "export process list to CSV"<br>
-→ Get-Process | Export-Csv -Path processes.csv -NoTypeInformation
-                    </div>
-                    <strong>PowerShell-specific features:</strong>
-                    <ul>
-                        <li>Cmdlet suggestions</li>
-                        <li>Pipeline operations</li>
-                        <li>Object manipulation</li>
-                        <li>Windows system administration</li>
-                    </ul>
-        """),
-        
-        ("What data does GitHub Copilot CLI send to GitHub?", """
-                    <strong>Data transmitted:</strong>
-                    <ul>
-                        <li><strong>Your query text:</strong> The natural language prompt you provide</li>
-                        <li><strong>Shell type:</strong> bash, zsh, PowerShell, etc.</li>
-                        <li><strong>OS information:</strong> Operating system type</li>
-                        <li><strong>Authentication:</strong> GitHub token for authorization</li>
-                    </ul>
-                    <strong>NOT transmitted:</strong>
-                    <ul>
-                        <li>❌ Your command history</li>
-                        <li>❌ File contents from your system</li>
-                        <li>❌ Directory structure</li>
-                        <li>❌ Environment variables</li>
-                    </ul>
-                    <strong>Data usage:</strong>
-                    <ul>
-                        <li><strong>Business/Enterprise:</strong> Your queries are NOT used for training</li>
-                        <li><strong>Individual:</strong> May be used to improve models</li>
-                    </ul>
-        """),
-        
-        ("Can GitHub Copilot CLI replace traditional command-line documentation?", """
-                    <strong>No</strong>, it's a complement, not a replacement:
-                    <br><br>
-                    <strong>GitHub Copilot CLI strengths:</strong>
-                    <ul>
-                        <li>✅ Quick suggestions for common tasks</li>
-                        <li>✅ Natural language interface</li>
-                        <li>✅ Cross-tool knowledge</li>
-                        <li>✅ Learning aid for new commands</li>
-                    </ul>
-                    <strong>Traditional docs strengths:</strong>
-                    <ul>
-                        <li>✅ Comprehensive reference</li>
-                        <li>✅ Authoritative information</li>
-                        <li>✅ Offline availability</li>
-                        <li>✅ Detailed edge cases</li>
-                    </ul>
-                    <strong>Best approach:</strong> Use Copilot CLI for quick tasks and exploration, then consult official docs for critical operations or deep learning.
-        """),
-        
-        ("How does rate limiting affect GitHub Copilot CLI usage?", """
-                    <strong>Rate limits apply:</strong>
-                    <ul>
-                        <li>Standard GitHub API rate limits</li>
-                        <li>Typically 5,000 requests/hour for authenticated users</li>
-                        <li>Shared with other GitHub API usage</li>
-                    </ul>
-                    <strong>Practical impact:</strong>
-                    <ul>
-                        <li>Normal usage rarely hits limits</li>
-                        <li>Issues may occur with automated scripts</li>
-                        <li>Heavy users in organizations share limits</li>
-                    </ul>
-                    <strong>If you hit rate limits:</strong>
-                    <div class="code-block">
-# Check rate limit status<br>
-gh api rate_limit<br>
-<br>
-# Wait for reset (displayed in response)<br>
-# Or use GitHub App for higher limits
-                    </div>
-        """),
-        
-        ("Can you create aliases for frequently used Copilot CLI queries?", """
-                    <strong>Yes!</strong> Create shell aliases or functions:
-                    <br><br>
-                    <strong>Bash/Zsh aliases (~/.bashrc or ~/.zshrc):</strong>
-                    <div class="code-block">
-# Quick suggest<br>
-alias ghcs='gh copilot suggest'<br>
-alias ghce='gh copilot explain'<br>
-<br>
-# Domain-specific helpers<br>
-alias ghgit='gh copilot suggest --shell bash --domain git'<br>
-alias ghdocker='gh copilot suggest --shell bash --domain docker'<br>
-<br>
-# Custom functions<br>
-function ghhelp() {<br>
-    gh copilot suggest "how to $*"<br>
+    topic = get_topic(5)
+    return render_topic(topic, load_qa(topic))
+
+# Hub page
+HUB_FILENAME = "index.html"
+
+HUB_CSS = """        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            padding: 20px;
+        }
+
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+            overflow: hidden;
+        }
+
+        header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+
+        header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+        }
+
+        header p {
+            font-size: 1.2em;
+            opacity: 0.9;
+        }
+
+        .search-container {
+            padding: 30px;
+            background: #f8f9fa;
+            border-bottom: 2px solid #e9ecef;
+        }
+
+        .search-box {
+            display: flex;
+            gap: 10px;
+            max-width: 600px;
+            margin: 0 auto;
+        }
+
+        .search-box input {
+            flex: 1;
+            padding: 12px 20px;
+            border: 2px solid #ddd;
+            border-radius: 25px;
+            font-size: 16px;
+            transition: border-color 0.3s;
+        }
+
+        .search-box input:focus {
+            outline: none;
+            border-color: #667eea;
+        }
+
+        .search-results {
+            max-width: 600px;
+            margin: 10px auto 0;
+        }
+
+        .search-hit {
+            display: block;
+            padding: 10px 20px;
+            border-bottom: 1px solid #e9ecef;
+            text-decoration: none;
+            color: inherit;
+        }
+
+        .search-hit:hover {
+            background: white;
+        }
+
+        .search-hit strong {
+            display: block;
+            color: #2d3748;
+        }
+
+        .search-hit span, .search-empty {
+            color: #666;
+            font-size: 0.85em;
+        }
+
+        .search-empty {
+            padding: 10px 20px;
+        }
+
+        .content {
+            padding: 40px;
+        }
+
+        .topic-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 25px;
+            margin-top: 20px;
+        }
+
+        .topic-card {
+            background: white;
+            border: 2px solid #e9ecef;
+            border-radius: 12px;
+            padding: 25px;
+            transition: all 0.3s ease;
+            cursor: pointer;
+            text-decoration: none;
+            color: inherit;
+            display: block;
+        }
+
+        .topic-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3);
+            border-color: #667eea;
+        }
+
+        .topic-card h3 {
+            color: #667eea;
+            font-size: 1.4em;
+            margin-bottom: 10px;
+        }
+
+        .topic-card p {
+            color: #666;
+            font-size: 0.95em;
+        }
+
+        .topic-card .question-count {
+            display: inline-block;
+            background: #667eea;
+            color: white;
+            padding: 5px 15px;
+            border-radius: 20px;
+            font-size: 0.85em;
+            margin-top: 15px;
+        }
+
+        footer {
+            background: #2d3748;
+            color: white;
+            text-align: center;
+            padding: 20px;
+            margin-top: 40px;
+        }
+
+        @media print {
+            body {
+                background: white;
+            }
+            .search-container {
+                display: none;
+            }
+            .topic-card {
+                page-break-inside: avoid;
+            }
+        }
+
+        @media (max-width: 768px) {
+            header h1 {
+                font-size: 1.8em;
+            }
+            .topic-grid {
+                grid-template-columns: 1fr;
+            }
+        }
+"""
+
+QA_ITEM_RE = re.compile(rb'class="qa-item"')
+
+def get_hub_template(total_count):
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitHub Copilot - 300 Q&A Hub</title>
+    <style>
+{HUB_CSS}    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>🚀 GitHub Copilot Knowledge Base</h1>
+            <p>Comprehensive {total_count} Q&A Collection</p>
+        </header>
+
+        <div class="search-container">
+            <div class="search-box">
+                <input type="text" id="searchInput" placeholder="Search topics and questions..." onkeyup="filterTopics()">
+            </div>
+            <div class="search-results" id="searchResults"></div>
+        </div>
+
+        <div class="content">
+            <h2 style="margin-bottom: 20px; color: #2d3748;">📚 Topic Categories</h2>
+            
+            <div class="topic-grid" id="topicGrid">
+"""
+
+def hub_card(topic, qa_count, page_count=1):
+    pages = f" · {page_count} Pages" if page_count > 1 else ""
+    return f"""                <a href="{topic['filename']}" class="topic-card">
+                    <h3>{topic['num']}. {topic['name']}</h3>
+                    <p>{topic['description']}</p>
+                    <span class="question-count">{qa_count} Questions{pages}</span>
+                </a>
+"""
+
+def get_hub_footer(generated, offline=False):
+    return f"""            </div>
+        </div>
+
+        <footer>
+            <p>&copy; 2025 GitHub Copilot Knowledge Base{f" | Generated: {generated:%B} {generated.day}, {generated.year}" if generated else ""}</p>
+        </footer>
+    </div>
+
+    <script>
+        function filterTopics() {{
+            const input = document.getElementById('searchInput');
+            const filter = input.value.toLowerCase();
+            const cards = document.getElementsByClassName('topic-card');
+
+            for (let i = 0; i < cards.length; i++) {{
+                const card = cards[i];
+                const text = card.textContent || card.innerText;
+                
+                if (text.toLowerCase().indexOf(filter) > -1) {{
+                    card.style.display = '';
+                }} else {{
+                    card.style.display = 'none';
+                }}
+            }}
+        }}
+    </script>
+    <script src="{SEARCH_SCRIPT_NAME}" defer></script>
+{SW_REGISTER_SCRIPT if offline else ""}</body>
+</html>"""
+
+# Question counts of hand-written pages, by path (see cached_by_signature)
+_static_count_cache = {}
+
+def page_path(output_dir, topic):
+    """Where a topic's page lives: the output directory, or the repo for hand-written pages."""
+    path = output_dir / topic["filename"]
+    if is_generated(topic) or path.exists():
+        return path
+    return SITE_DIR / topic["filename"]
+
+def count_page_questions(path):
+    return cached_by_signature(_static_count_cache, path, lambda path: len(QA_ITEM_RE.findall(path.read_bytes())))
+
+def topic_question_count(output_dir, topic):
+    if is_generated(topic):
+        return len(load_qa(topic))
+    return count_page_questions(page_path(output_dir, topic))
+
+def write_static_pages(output_dir, compress=False):
+    """Copy the hand-written topic pages into output_dir, so it holds the whole site."""
+    if output_dir.resolve() == SITE_DIR:
+        return
+    for topic in TOPICS:
+        if not is_generated(topic):
+            write_site_file(output_dir, topic["filename"], (SITE_DIR / topic["filename"]).read_bytes(), compress)
+
+def write_hub(output_dir, per_page=None, offline=False, compress=False):
+    write_site_file(output_dir, HUB_FILENAME, encode_page(render_hub(output_dir, per_page, offline)), compress)
+
+def render_hub(output_dir, per_page=None, offline=False):
+    """Render the hub page from the registry, with counts taken from the content itself.
+
+    Generated topics split by per_page show how many pages they span.
+    The "Generated" date comes from content_date(), so the hub is the same
+    whenever and wherever the same content is built.
+    """
+    cards = []
+    total = 0
+    for topic in TOPICS:
+        count = topic_question_count(output_dir, topic)
+        total += count
+        page_count = math.ceil(count / per_page) if per_page and is_generated(topic) else 1
+        cards.append(hub_card(topic, count, page_count))
+    return (get_hub_template(total) + "\n".join(cards)
+            + get_hub_footer(content_date(), offline))
+
+@lru_cache(maxsize=None)
+def content_date():
+    """Date the content was last changed: SOURCE_DATE_EPOCH if set, else its last commit.
+
+    File modification times are not used, since a fresh checkout resets
+    them. Returns None (and the hub shows no date) outside a git checkout.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        paths = [str(CONTENT_DIR)] + [topic["filename"] for topic in TOPICS if not is_generated(topic)]
+        try:
+            epoch = subprocess.run(["git", "log", "-1", "--format=%ct", "--", *paths], cwd=SITE_DIR,
+                                   capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    return datetime.fromtimestamp(int(epoch), timezone.utc) if epoch else None
+
+# Search index
+SEARCH_JS = """// Question-level search for the hub page. The index is generated by
+// generate_topics.py and only fetched the first time the search box is used.
+(function () {
+    var MAX_RESULTS = 10;
+    var MAX_PREFIX_TERMS = 50;
+    var input = document.getElementById('searchInput');
+    var results = document.getElementById('searchResults');
+    if (!input || !results) return;
+
+    var index = null;
+    var terms = null;
+    var stopWords = null;
+    var loading = null;
+
+    function load() {
+        if (!loading) {
+            loading = fetch('""" + SEARCH_INDEX_NAME + """')
+                .then(function (response) {
+                    if (!response.ok) throw new Error(response.status);
+                    return response.json();
+                })
+                .then(function (data) {
+                    index = data;
+                    terms = Object.keys(data.terms).sort();
+                    stopWords = new Set(data.stop);
+                })
+                .catch(function () { loading = null; });
+        }
+        return loading;
+    }
+
+    function tokenize(text) {
+        return text.toLowerCase().split(/[^\\p{L}\\p{N}]+/u).filter(Boolean);
+    }
+
+    // Terms starting with prefix, found by binary search over the sorted term list
+    function prefixTerms(prefix) {
+        var lo = 0, hi = terms.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1;
+            if (terms[mid] < prefix) lo = mid + 1; else hi = mid;
+        }
+        var found = [];
+        for (var i = lo; i < terms.length && found.length < MAX_PREFIX_TERMS && terms[i].indexOf(prefix) === 0; i++) {
+            found.push(terms[i]);
+        }
+        return found;
+    }
+
+    function search(query) {
+        // Stop words are not indexed, so drop them like the indexer does; a
+        // last word still being typed may yet become a longer indexed word
+        var typing = /[\\p{L}\\p{N}]$/u.test(query);
+        var tokens = tokenize(query);
+        tokens = tokens.filter(function (token, i) {
+            return !stopWords.has(token) || (typing && i === tokens.length - 1);
+        });
+        var scores = null;
+        tokens.forEach(function (token, i) {
+            // The last word is still being typed, so match it as a prefix
+            var words = i === tokens.length - 1 ? prefixTerms(token) : [token];
+            var matched = new Map();
+            words.forEach(function (word) {
+                var postings = index.terms[word];
+                if (!postings) return;
+                for (var j = 0; j < postings.length; j += 2) {
+                    matched.set(postings[j], (matched.get(postings[j]) || 0) + postings[j + 1]);
+                }
+            });
+            if (scores === null) {
+                scores = matched;
+            } else {
+                var both = new Map();
+                matched.forEach(function (score, doc) {
+                    if (scores.has(doc)) both.set(doc, scores.get(doc) + score);
+                });
+                scores = both;
+            }
+        });
+        if (!scores) return [];
+        return Array.from(scores).sort(function (a, b) {
+            return b[1] - a[1] || a[0] - b[0];
+        }).slice(0, MAX_RESULTS);
+    }
+
+    function render(hits, query) {
+        results.textContent = '';
+        if (!hits.length) {
+            var empty = document.createElement('p');
+            empty.className = 'search-empty';
+            empty.textContent = 'No questions match "' + query + '"';
+            results.appendChild(empty);
+            return;
+        }
+        hits.forEach(function (hit) {
+            var doc = index.docs[hit[0]];
+            var page = index.pages[doc[0]];
+            var link = document.createElement('a');
+            link.className = 'search-hit';
+            link.href = page[0] + '#' + doc[2];
+            var question = document.createElement('strong');
+            question.textContent = doc[1];
+            var topic = document.createElement('span');
+            topic.textContent = page[1];
+            link.appendChild(question);
+            link.appendChild(topic);
+            results.appendChild(link);
+        });
+    }
+
+    input.addEventListener('focus', load);
+    input.addEventListener('input', function () {
+        var query = input.value;
+        if (!query.trim()) {
+            results.textContent = '';
+            return;
+        }
+        load().then(function () {
+            if (index && input.value === query) render(search(query), query);
+        });
+    });
+})();
+"""
+
+STOP_WORDS = frozenset("""
+    a an and are as at be by can do does for from how if in into is it its of on or
+    that the this to was what when which with you your
+""".split())
+
+TAG_RE = re.compile(r"<[^>]+>")
+TOKEN_RE = re.compile(r"[^\W_]+")
+SLUG_RE = re.compile(r"[a-z0-9]+")
+
+def tokenize(text):
+    """Lowercased words of an HTML fragment, matching the tokenizer in SEARCH_JS."""
+    text = html.unescape(TAG_RE.sub(" ", text)).lower()
+    return [t for t in TOKEN_RE.findall(text) if t not in STOP_WORDS]
+
+def build_search_index(topics, per_page=None):
+    """Build a compact inverted index over every question and answer.
+
+    topics is a sequence of (topic, qa_list) pairs; each doc is
+    [page, question text, anchor], so hits link straight to the question on
+    the page it ends up on when topics are split by per_page. Postings are flat
+    [doc, weight, doc, weight, ...] lists with integer tf-idf weights,
+    question words counting QUESTION_WEIGHT times. "stop" lists the
+    STOP_WORDS left out, so the client can drop them from queries too.
+    """
+    pages = []
+    docs = []
+    postings = {}
+    for topic, qa_list in topics:
+        for page_num, (filename, page_qa) in enumerate(paginate(topic, qa_list, per_page), 1):
+            page = len(pages)
+            title = topic["title"] if page_num == 1 else f"{topic['title']} (page {page_num})"
+            pages.append([filename, title])
+            for question, answer in page_qa:
+                doc = len(docs)
+                docs.append([page, html.unescape(TAG_RE.sub("", question)).strip(),
+                             question_anchor(question)])
+                counts = {}
+                for term in tokenize(question):
+                    counts[term] = counts.get(term, 0) + QUESTION_WEIGHT
+                for term in tokenize(answer):
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    postings.setdefault(term, []).append((doc, tf))
+
+    terms = {}
+    for term in sorted(postings):
+        idf = math.log(1 + len(docs) / len(postings[term]))
+        flat = []
+        for doc, tf in postings[term]:
+            # Saturating term frequency, so long answers don't drown out questions
+            flat += [doc, max(1, round(100 * idf * tf / (tf + 1.2)))]
+        terms[term] = flat
+    return {"pages": pages, "docs": docs, "terms": terms, "stop": sorted(STOP_WORDS)}
+
+def build_anchor_table(topics, per_page=None):
+    """Map every question anchor to [page, offset]: its page and position on that page.
+
+    Pages are listed once in "pages" and referenced by index, like the
+    search index.
+    """
+    pages = []
+    anchors = {}
+    for topic, qa_list in topics:
+        for filename, page_qa in paginate(topic, qa_list, per_page):
+            for offset, (question, _) in enumerate(page_qa):
+                anchors.setdefault(question_anchor(question), [len(pages), offset])
+            pages.append(filename)
+    return {"pages": pages, "anchors": anchors}
+
+def search_files(topics, per_page=None):
+    """The search index, its script and the question anchor table as {filename: bytes}."""
+    index = build_search_index(topics, per_page)
+    anchors = build_anchor_table(topics, per_page)
+    return {
+        SEARCH_INDEX_NAME: json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        SEARCH_SCRIPT_NAME: encode_page(SEARCH_JS),
+        ANCHORS_NAME: json.dumps(anchors, separators=(",", ":")).encode("utf-8"),
+    }
+
+def write_search_index(output_dir, topics, per_page=None, compress=False):
+    """Write the search index, its script and the question anchor table."""
+    for name, payload in search_files(topics, per_page).items():
+        write_site_file(output_dir, name, payload, compress)
+
+def write_site_file(output_dir, name, data, compress=False):
+    """Write one of the site-wide files, with precompressed variants like the pages."""
+    changed, _, size, variants = write_stream(output_dir / name, [data], compress)
+    if changed:
+        print(f"✅ Created: {name}")
+        if compress:
+            print(f"   🗜️  {compression_report(size, variants)}")
+
+# Offline support
+SERVICE_WORKER_JS = """// Offline support for the Q&A site, generated by generate_topics.py.
+// The precache manifest maps every page and asset to a content hash; when
+// it changes, only the entries whose hash changed are downloaded again.
+var VERSION = '%VERSION%';
+var CACHE = 'copilot-qa';
+var MANIFEST = '""" + PRECACHE_NAME + """';
+var HUB = '""" + HUB_FILENAME + """';
+
+function fetchOk(url, init) {
+    return fetch(url, init).then(function (response) {
+        if (!response.ok) throw new Error(url + ': ' + response.status);
+        return response;
+    });
 }
-                    </div>
-                    <strong>PowerShell functions (profile.ps1):</strong>
-                    <div class="code-block">
-function ghcs { gh copilot suggest $args }<br>
-function ghce { gh copilot explain $args }
-                    </div>
-        """)
-    ]
-    
-    content = get_html_template(5, "🖥️ Topic 5: GHC CLI Commands & Limitations", 
-                                "25 Comprehensive Questions & Answers", 25,
-                                "04-metrics-api.html", "06-usage-analytics.html")
-    
+
+self.addEventListener('install', function (event) {
+    event.waitUntil(Promise.all([caches.open(CACHE), fetchOk(MANIFEST, {cache: 'no-store'})])
+        .then(function (opened) {
+            var cache = opened[0];
+            var response = opened[1];
+            return Promise.all([
+                cache.match(MANIFEST).then(function (old) { return old ? old.json() : {files: {}}; }),
+                response.clone().json()
+            ]).then(function (manifests) {
+                var previous = manifests[0].files;
+                var files = manifests[1].files;
+                var changed = Object.keys(files).filter(function (url) { return previous[url] !== files[url]; });
+                var removed = Object.keys(previous).filter(function (url) { return !(url in files); });
+                return Promise.all(changed.map(function (url) {
+                    return fetchOk(url, {cache: 'no-cache'}).then(function (page) { return cache.put(url, page); });
+                })).then(function () {
+                    return Promise.all(removed.map(function (url) { return cache.delete(url); }));
+                }).then(function () {
+                    return cache.put(MANIFEST, response);
+                });
+            });
+        })
+        .then(function () { return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function (event) {
+    event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener('fetch', function (event) {
+    var request = event.request;
+    var url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== location.origin) return;
+    event.respondWith(caches.open(CACHE).then(function (cache) {
+        var key = url.pathname.slice(-1) === '/' ? HUB : request;
+        return cache.match(key, {ignoreSearch: true}).then(function (cached) {
+            return cached || fetch(request).catch(function (error) {
+                if (request.mode !== 'navigate') throw error;
+                return cache.match(HUB).then(function (hub) {
+                    if (!hub) throw error;
+                    return hub;
+                });
+            });
+        });
+    }));
+});
+"""
+
+# Hashes of files not recorded in the build manifest, by path (see cached_by_signature)
+_static_hash_cache = {}
+
+def static_file_hash(path):
+    return cached_by_signature(_static_hash_cache, path, file_hash)
+
+def site_files(output_dir, manifest, assets=None):
+    """List the built site as (name, path, sha256 or None) tuples.
+
+    Generated pages carry the hash recorded in the build manifest. Only
+    files that exist in output_dir are listed: hand-written pages, the hub,
+    search files, shared assets and shared answer fragments are left out
+    when they are missing there, since a client fetching them would get a 404.
+    """
+    files = []
+    for topic in TOPICS:
+        if is_generated(topic):
+            for page in manifest.get(topic["filename"], {}).get("pages", []):
+                files.append((page["filename"], output_dir / page["filename"], page["output"]))
+        elif (output_dir / topic["filename"]).exists():
+            files.append((topic["filename"], output_dir / topic["filename"], None))
+    for name in [HUB_FILENAME, SEARCH_SCRIPT_NAME, SEARCH_INDEX_NAME, ANCHORS_NAME] + sorted((assets or {}).values()):
+        if (output_dir / name).exists():
+            files.append((name, output_dir / name, None))
+    for path in sorted(output_dir.glob(f"{INCLUDE_PREFIX}.*.html")):
+        files.append((path.name, path, None))
+    return files
+
+def precache_files(output_dir, manifest, assets=None):
+    """Map every page and asset of the site to a short content hash.
+
+    Generated pages reuse the hashes recorded in the build manifest;
+    everything else is hashed from disk.
+    """
+    return {name: (digest or static_file_hash(path))[:16]
+            for name, path, digest in site_files(output_dir, manifest, assets)}
+
+def write_service_worker(output_dir, manifest, assets=None):
+    """Write the precache manifest and the service worker that installs it.
+
+    The worker embeds the manifest's version, so browsers only pick up a new
+    worker (and re-download changed entries) when some content hash changed.
+    """
+    files = precache_files(output_dir, manifest, assets)
+    data = json.dumps(files, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    version = hashlib.sha256(data).hexdigest()[:16]
+    precache = json.dumps({"version": version, "files": files}, indent=2, sort_keys=True) + "\n"
+    worker = SERVICE_WORKER_JS.replace("%VERSION%", version)
+    for name, payload in ((PRECACHE_NAME, precache.encode("utf-8")), (SERVICE_WORKER_NAME, encode_page(worker))):
+        if write_if_changed(output_dir / name, payload):
+            print(f"✅ Created: {name}")
+
+# Export
+EXPORT_FORMATS = (".html", ".zip", ".tar.gz", ".tgz")
+
+# Fixed metadata so the same site always exports to the same bytes
+ARCHIVE_DATE = (1980, 1, 1, 0, 0, 0)
+ARCHIVE_MODE = 0o644
+
+ASSET_LINK_RE = re.compile(
+    r'<link rel="stylesheet" href="(' + re.escape(ASSET_PREFIX) + r'\.[0-9a-f]+\.css)">'
+    r'|<script src="(' + re.escape(ASSET_PREFIX) + r'\.[0-9a-f]+\.js|'
+    + re.escape(SEARCH_SCRIPT_NAME) + r')"(?: defer)?></script>')
+
+BUNDLE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitHub Copilot Q&A</title>
+    <style>
+        html, body, iframe {margin: 0; width: 100%; height: 100%; border: 0; display: block;}
+    </style>
+</head>
+<body>
+    <iframe id="bundle-view" title="GitHub Copilot Q&A"></iframe>
+"""
+
+# Shows one bundled page at a time in the iframe; links between bundled
+# pages switch pages through location.hash so back/forward keep working
+BUNDLE_JS = """(function () {
+    var HUB = '""" + HUB_FILENAME + """';
+    var files = {};
+    var blocks = document.querySelectorAll('script[data-file]');
+    for (var i = 0; i < blocks.length; i++) {
+        files[blocks[i].getAttribute('data-file')] = JSON.parse(blocks[i].textContent);
+    }
+    var view = document.getElementById('bundle-view');
+    var networkFetch = window.fetch;
+
+    // Bundled pages use this instead of fetch, e.g. for the search index
+    window.bundleFetch = function (url) {
+        var name = String(url).split(/[?#]/)[0];
+        if (name in files) return Promise.resolve(new Response(files[name]));
+        return networkFetch.apply(window, arguments);
+    };
+
+    function show() {
+        var target = decodeURIComponent(location.hash.slice(1)).split('#');
+        var name = target[0] in files ? target[0] : HUB;
+        view.onload = function () {
+            var doc = view.contentDocument;
+            document.title = doc.title;
+            doc.addEventListener('click', function (event) {
+                var link = event.target.closest('a[href]');
+                if (!link) return;
+                var href = link.getAttribute('href').split('#');
+                if (!(href[0] in files)) return;
+                event.preventDefault();
+                location.hash = href[0] + (href[1] ? '#' + href[1] : '');
+            });
+            var anchor = target[1] && doc.getElementById(target[1]);
+            if (anchor) anchor.scrollIntoView();
+        };
+        view.srcdoc = files[name];
+    }
+
+    window.addEventListener('hashchange', show);
+    show();
+})();
+"""
+
+BUNDLE_FETCH_SCRIPT = "<script>if (parent.bundleFetch) fetch = parent.bundleFetch;</script>"
+
+def export_files(output_dir, manifest=None):
+    """The built site as sorted (name, path) pairs, including the assets its pages link."""
+    if manifest is None:
+        manifest = load_manifest(output_dir)
+    files = {name: path for name, path, _ in site_files(output_dir, manifest)}
+    for name, path in list(files.items()):
+        if name.endswith(".html"):
+            for css, js in ASSET_LINK_RE.findall(path.read_text(encoding="utf-8")):
+                files.setdefault(css or js, output_dir / (css or js))
+    # The service worker only belongs to builds whose hub registers it
+    hub = files.get(HUB_FILENAME)
+    if hub and SW_REGISTER_SCRIPT in hub.read_text(encoding="utf-8"):
+        for name in (SERVICE_WORKER_NAME, PRECACHE_NAME):
+            files[name] = output_dir / name
+    return sorted(files.items())
+
+# Differential deploy
+def deploy_files(output_dir, manifest):
+    """Map every file of the built site, precompressed variants included, to its sha256 and size."""
+    digests = {name: digest for name, _, digest in site_files(output_dir, manifest) if digest}
+    files = {}
+    for name, path in export_files(output_dir, manifest):
+        for suffix in ("",) + VARIANT_SUFFIXES:
+            variant = variant_path(path, suffix) if suffix else path
+            try:
+                size = variant.stat().st_size
+            except OSError:
+                continue
+            digest = digests.get(name) if not suffix else None
+            files[name + suffix] = {"sha256": digest or static_file_hash(variant), "size": size}
+    return files
+
+def deploy_diff(previous, files):
+    """Names added, changed (different hash) and removed since the previous file map."""
+    return {
+        "added": sorted(name for name in files if name not in previous),
+        "changed": sorted(name for name in files
+                          if name in previous and previous[name]["sha256"] != files[name]["sha256"]),
+        "removed": sorted(name for name in previous if name not in files),
+    }
+
+def write_deploy_manifest(output_dir, manifest):
+    """Write DEPLOY_MANIFEST_NAME for the finished build and return its diff.
+
+    The manifest holds {"files": {name: {"sha256", "size"}}, "diff": {"added",
+    "changed", "removed"}}, the diff being against the manifest of the
+    previous build, so deploy jobs can upload and purge only those files.
+    "build" and "previous" identify the two file maps.
+    """
+    path = output_dir / DEPLOY_MANIFEST_NAME
+    try:
+        previous = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+    files = deploy_files(output_dir, manifest)
+    diff = deploy_diff(previous.get("files", {}), files)
+    build = hashlib.sha256(json.dumps(files, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    data = {"build": build, "previous": previous.get("build"), "files": files, "diff": diff}
+    write_if_changed(path, (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+    upload = sum(files[name]["size"] for name in diff["added"] + diff["changed"])
+    print(f"🚀 Deploy: {len(diff['added'])} added, {len(diff['changed'])} changed, "
+          f"{len(diff['removed'])} removed ({upload:,} B to upload)")
+    return diff
+
+def inline_assets(page, files):
+    """Make a page self-contained: inline linked assets, drop the service worker."""
+    def inline(match):
+        css, js = match.groups()
+        source = files[css or js].read_text(encoding="utf-8")
+        return f"<style>\n{source}</style>" if css else f"<script>\n{source}</script>"
+    page = ASSET_LINK_RE.sub(inline, page).replace(SW_REGISTER_SCRIPT, "")
+    return page.replace("<head>", "<head>\n    " + BUNDLE_FETCH_SCRIPT, 1)
+
+def iter_bundle(files):
+    """Yield a single HTML file holding every page, switched client-side."""
+    files = dict(files)
+    yield BUNDLE_HEAD
+    for name, path in files.items():
+        if name.endswith(".html"):
+            data = inline_assets(path.read_text(encoding="utf-8"), files)
+        elif name in (SEARCH_INDEX_NAME, ANCHORS_NAME):
+            data = path.read_text(encoding="utf-8")
+        else:
+            continue
+        # "</" is escaped so page markup can't close the data block early
+        payload = json.dumps(data, ensure_ascii=False).replace("</", "<\\/")
+        yield f'    <script type="application/json" data-file="{html.escape(name)}">{payload}</script>\n'
+    yield f"    <script>\n{BUNDLE_JS}    </script>\n</body>\n</html>\n"
+
+def write_zip(f, files):
+    with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        for name, path in files:
+            info = zipfile.ZipInfo(name, date_time=ARCHIVE_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            info.external_attr = (0o100000 | ARCHIVE_MODE) << 16
+            with open(path, 'rb') as src, archive.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst, WRITE_BUFFER_SIZE)
+
+def write_tar_gz(f, files):
+    with gzip.GzipFile(filename="", mode="wb", fileobj=f, compresslevel=9, mtime=0) as gz, \
+            tarfile.open(fileobj=gz, mode="w", format=tarfile.USTAR_FORMAT) as archive:
+        for name, path in files:
+            info = tarfile.TarInfo(name)
+            info.size = path.stat().st_size
+            info.mode = ARCHIVE_MODE
+            info.mtime = 0
+            with open(path, 'rb') as src:
+                archive.addfile(info, src)
+
+def export_site(output_dir, target):
+    """Export the built site in output_dir to target, chosen by its extension.
+
+    .html writes one self-contained page with client-side topic switching;
+    .zip and .tar.gz/.tgz write an archive with sorted entries and fixed
+    timestamps, so the same site always exports to the same bytes. Files are
+    streamed from the build output; nothing is copied to disk first. The
+    build lock is held throughout, so a concurrent build can't change the
+    site halfway through. Returns the number of files exported.
+    """
+    output_dir = Path(output_dir)
+    target = Path(target)
+    with build_lock(output_dir):
+        files = export_files(output_dir)
+        if target.name.endswith(".html"):
+            pages = [(name, path) for name, path in files if name not in (SERVICE_WORKER_NAME, PRECACHE_NAME)]
+            changed, _, size, _ = write_stream(target, iter_bundle(pages))
+        elif target.name.endswith(EXPORT_FORMATS):
+            tmp = temp_path(target)
+            with open(tmp, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                (write_zip if target.name.endswith(".zip") else write_tar_gz)(f, files)
+                fsync_file(f)
+            size = tmp.stat().st_size
+            changed = replace_if_changed(tmp, target, file_hash(tmp), size)
+        else:
+            raise ValueError(f"{target}: unsupported export format (use {', '.join(EXPORT_FORMATS)})")
+        print(f"{'📦 Exported' if changed else '⏭️  Unchanged'}: {target} ({len(files)} files, {size:,} B)")
+        return len(files)
+
+# Validation
+SCAN_TAG_RE = re.compile(r'<[a-zA-Z][^<>]*>')
+SCAN_ATTR_RE = re.compile(r'(?<![\w-])(href|src|data-include|id|class)="([^"]*)"')
+NAV_LINK_RE = re.compile(r'<a href="([^"]*)">(← Previous|Next Topic →)</a>')
+EXTERNAL_LINK_RE = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+
+def scan_page(path):
+    """Collect the links, IDs and prev/next navigation of one page.
+
+    The page is read line by line and only its tags are looked at, so this
+    stays cheap enough to run on every build. Returns a dict with "links"
+    and "ids" as [value, line] lists, "question_ids" for IDs on .qa-item
+    elements and "nav" mapping "prev"/"next" to their hrefs.
+    """
+    scan = {"links": [], "ids": [], "question_ids": [], "nav": {}}
+    pending = ""
+    with open(path, encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            # Carry a tag that continues on the next line
+            text = pending + line
+            cut = text.rfind("<")
+            if cut > text.rfind(">"):
+                text, pending = text[:cut], text[cut:]
+            else:
+                pending = ""
+            for tag in SCAN_TAG_RE.findall(text):
+                attrs = dict(SCAN_ATTR_RE.findall(tag))
+                for attr in ("href", "src", "data-include"):
+                    if attr in attrs:
+                        scan["links"].append([attrs[attr], line_num])
+                if "id" in attrs:
+                    scan["ids"].append([attrs["id"], line_num])
+                    if "qa-item" in attrs.get("class", "").split():
+                        scan["question_ids"].append([attrs["id"], line_num])
+            for href, label in NAV_LINK_RE.findall(text):
+                scan["nav"]["prev" if label.startswith("←") else "next"] = href
+    return scan
+
+def expected_nav(topic):
+    """The prev/next filenames a topic's pages should link to, from registry order."""
+    index = TOPICS.index(topic)
+    nav = {}
+    if index > 0:
+        nav["prev"] = TOPICS[index - 1]["filename"]
+    if index + 1 < len(TOPICS):
+        nav["next"] = TOPICS[index + 1]["filename"]
+    return nav
+
+def validate_site(output_dir, manifest, assets=None, pool=None, alongside=()):
+    """Check the built site's internal links, anchors, navigation and IDs.
+
+    Links must resolve to files in output_dir, or to one of the names in
+    alongside for files deployed next to it by other means. Every page is
+    scanned once (on pool when given). Reports and returns the problems as
+    (page, ValueError) pairs, like generate_all_topics() failures.
+    """
+    files = site_files(output_dir, manifest, assets)
+    pages = {name: path for name, path, _ in files if name.endswith(".html")}
+    scans = dict(zip(pages, run_stage(pool, scan_page, [(path,) for path in pages.values()])))
+    known = {name for name, _, _ in files} | set(alongside)
+
+    def exists(name):
+        return name in known or (output_dir / name).exists()
+
+    problems = []
+    question_pages = {}
+    for name, scan in scans.items():
+        if isinstance(scan, Exception):
+            problems.append((name, scan))
+            continue
+        seen = {}
+        for element_id, line_num in scan["ids"]:
+            if element_id in seen:
+                problems.append((name, ValueError(f"line {line_num}: duplicate id {element_id!r} "
+                                                  f"(first on line {seen[element_id]})")))
+            seen.setdefault(element_id, line_num)
+        for element_id, line_num in scan["question_ids"]:
+            first = question_pages.setdefault(element_id, name)
+            if first != name:
+                problems.append((name, ValueError(f"line {line_num}: question id {element_id!r} "
+                                                  f"is also used in {first}")))
+        for href, line_num in scan["links"]:
+            if not href or EXTERNAL_LINK_RE.match(href):
+                continue
+            target, _, anchor = html.unescape(href).partition("#")
+            target = target.split("?")[0] or name
+            if not exists(target):
+                problems.append((name, ValueError(f"line {line_num}: broken link {href!r}")))
+            elif anchor and target in scans and not isinstance(scans[target], Exception) \
+                    and anchor not in {element_id for element_id, _ in scans[target]["ids"]}:
+                problems.append((name, ValueError(f"line {line_num}: missing anchor {href!r}")))
+
+    for topic in TOPICS:
+        nav = expected_nav(topic)
+        filenames = [page["filename"] for page in manifest.get(topic["filename"], {}).get("pages", [])]
+        for filename in filenames or [topic["filename"]]:
+            scan = scans.get(filename)
+            if isinstance(scan, dict) and scan["nav"] != nav:
+                problems.append((filename, ValueError(
+                    f"navigation {scan['nav']} does not match registry order {nav}")))
+
+    for page, problem in problems:
+        print(f"❌ Invalid: {page}: {problem}")
+    links = sum(len(scan["links"]) for scan in scans.values() if isinstance(scan, dict))
+    if not problems:
+        print(f"🔗 Validated {len(scans)} pages, {links} links")
+    return problems
+
+# Incremental build helpers
+def encode_page(content):
+    return content.replace("\n", LINE_ENDING).encode("utf-8")
+
+# Build options that change the files written for a topic
+OUTPUT_OPTIONS = ("minify", "compress", "lazy_answers", "per_page", "offline", "dedupe")
+
+def topic_input_hash(topic, qa_list, options=None):
+    """Hash everything a topic page is rendered from."""
+    options = options or {}
+    assets = options.get("assets")
+    h = hashlib.sha256()
+    h.update(json.dumps({name: options.get(name) for name in OUTPUT_OPTIONS}).encode("utf-8"))
+    h.update(json.dumps(sorted((options.get("includes") or {}).items()), ensure_ascii=False).encode("utf-8"))
     for q, a in qa_list:
-        content += qa_item(q, a)
-    
-    content += get_footer(5)
-    
-    return content
+        h.update(json.dumps([q, a], ensure_ascii=False).encode("utf-8"))
+    # The markup around the Q&A: both qa_item forms (via fragment_version),
+    # the pager, the lazy answers block, include slots, minification and line endings
+    markup = "".join([topic_header(topic, len(qa_list), assets), topic_footer(topic, assets, options.get("offline")),
+                      get_pager(["\0a", "\0b"], 1), lazy_answers_block([("\0q", "\0a")]), include_slot("\0i")])
+    h.update(markup.encode("utf-8"))
+    h.update(minify_html(markup).encode("utf-8"))
+    h.update(json.dumps([fragment_version(), LINE_ENDING]).encode("utf-8"))
+    return h.hexdigest()
+
+def load_manifest(output_dir):
+    try:
+        with open(output_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(output_dir, manifest):
+    data = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    write_if_changed(output_dir / MANIFEST_NAME, data.encode("utf-8"))
+
+def output_matches(output_dir, entry):
+    """True if every page on disk, and each precompressed variant kept for it, is still the one recorded."""
+    if not entry.get("pages"):
+        return False
+    for page in entry["pages"]:
+        path = output_dir / page["filename"]
+        try:
+            st = path.stat()
+            if st.st_size != page["size"] or st.st_mtime_ns != page["mtime_ns"]:
+                return False
+            for suffix, size in (page.get("variants") or {}).items():
+                if size is not None and variant_path(path, suffix).stat().st_size != size:
+                    return False
+        except OSError:
+            return False
+    return True
+
+def write_if_changed(filepath, data):
+    """Write data to filepath unless the file already holds exactly these bytes."""
+    try:
+        if filepath.stat().st_size == len(data) and filepath.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp = temp_path(filepath)
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            fsync_file(f)
+        os.replace(tmp, filepath)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    fsync_dir(filepath.parent)
+    return True
+
+def file_hash(filepath):
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(WRITE_BUFFER_SIZE), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def temp_path(filepath):
+    """Scratch file next to filepath that no other process or thread writes to."""
+    return filepath.with_name(f".{filepath.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+def fsync_file(f):
+    """Flush an open file through to disk, so it is complete before it is renamed into place."""
+    f.flush()
+    os.fsync(f.fileno())
+
+def fsync_dir(path):
+    """Make renames in a directory durable; a no-op where directories can't be opened (Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def replace_if_changed(tmp_path, filepath, digest, size):
+    """Move a finished temp file over filepath unless the contents are identical.
+
+    Leaving identical files alone keeps their mtimes (and any CDN cache
+    validators derived from them) stable. Returns True if filepath changed.
+    """
+    try:
+        unchanged = filepath.stat().st_size == size and file_hash(filepath) == digest
+    except OSError:
+        unchanged = False
+    if unchanged:
+        tmp_path.unlink()
+    else:
+        os.replace(tmp_path, filepath)
+        fsync_dir(filepath.parent)
+    return not unchanged
+
+# Build locks held by this process, as (lock path, thread id)
+_held_build_locks = set()
+
+@contextmanager
+def build_lock(output_dir):
+    """Hold output_dir's build lock, waiting for any other build to release it first.
+
+    Uses flock() where available, so the lock goes away with the process
+    that held it. Elsewhere the lock is a file created with O_EXCL, which a
+    crashed build leaves behind; such files are broken once they are older
+    than BUILD_LOCK_STALE_SECONDS. A thread that already holds the lock
+    (e.g. exporting at the end of a build) just carries on.
+    """
+    path = Path(output_dir) / BUILD_LOCK_NAME
+    key = (path.resolve(), threading.get_ident())
+    if key in _held_build_locks:
+        yield
+        return
+    with (flock_lock if fcntl is not None else exclusive_file_lock)(path, output_dir):
+        _held_build_locks.add(key)
+        try:
+            yield
+        finally:
+            _held_build_locks.discard(key)
+
+@contextmanager
+def flock_lock(path, output_dir):
+    with open(path, 'a') as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print(f"⏳ Waiting for another build of {output_dir} to finish")
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+@contextmanager
+def exclusive_file_lock(path, output_dir):
+    waiting = False
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                stale = path.stat()
+            except OSError:
+                continue  # released between the two calls
+            age = time.time() - stale.st_mtime
+            if age > BUILD_LOCK_STALE_SECONDS:
+                break_stale_lock(path, stale, age)
+                continue
+            if not waiting:
+                print(f"⏳ Waiting for another build of {output_dir} to finish")
+                waiting = True
+            time.sleep(BUILD_LOCK_POLL_SECONDS)
+    try:
+        os.write(fd, f"{os.getpid()}\n".encode("ascii"))
+        mine = os.fstat(fd)
+        os.close(fd)
+        yield
+    finally:
+        # Unless it was broken as stale and is someone else's by now
+        try:
+            if same_file(path.stat(), mine):
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+def same_file(a, b):
+    return (a.st_dev, a.st_ino, a.st_mtime_ns) == (b.st_dev, b.st_ino, b.st_mtime_ns)
+
+def break_stale_lock(path, stale, age):
+    """Remove the lock file stale (a stat result of path), if it is still the one at path.
+
+    Another waiter may have broken it already and taken a fresh lock since
+    stale was read, so the file is first renamed aside, which only one
+    waiter can do, and checked; a live lock taken by mistake is put back.
+    """
+    aside = path.with_name(f"{path.name}.{os.getpid()}.stale")
+    try:
+        os.rename(path, aside)
+    except FileNotFoundError:
+        return
+    if same_file(aside.stat(), stale):
+        print(f"⚠️  Breaking stale build lock {path} ({age:.0f} s old)")
+    else:
+        try:
+            os.link(aside, path)
+        except FileExistsError:
+            print(f"⚠️  Build lock {path} changed hands while breaking a stale lock")
+    aside.unlink()
+
+def new_compressors():
+    """Streaming compressors for each precompressed variant, as (feed, finish) pairs."""
+    gzip_compressor = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    compressors = {".gz": (gzip_compressor.compress, gzip_compressor.flush)}
+    if brotli is not None:
+        compressor = brotli.Compressor(quality=11)
+        compressors[".br"] = (compressor.process, compressor.finish)
+    return compressors
+
+def write_stream(filepath, chunks, compress=False, timings=None):
+    """Stream text chunks to filepath through a buffered temp file.
+
+    Chunks are text, or bytes that are written as they are. The page is
+    never held in memory as a whole; it is hashed as it is written and only
+    replaces filepath if the bytes differ. With compress, the same bytes are
+    fed through gzip (and brotli, if installed) as they are produced, and
+    each variant is kept as filepath + ".gz"/".br" only if it is worth
+    serving (see COMPRESS_MIN_SIZE/COMPRESS_MAX_RATIO).
+    Variants left over from an earlier build are removed otherwise.
+
+    Returns (changed, sha256, size, variants) where variants maps each
+    suffix to its compressed size, or None if it was not worth keeping.
+    If a timings dict is given, seconds spent producing chunks, writing and
+    compressing are added to its "render", "write" and "compress" keys.
+    """
+    compressors = new_compressors() if compress else {}
+    h = hashlib.sha256()
+    size = 0
+    variant_hashes = {suffix: hashlib.sha256() for suffix in compressors}
+    variant_sizes = dict.fromkeys(compressors, 0)
+
+    temps = [temp_path(filepath)] + [temp_path(variant_path(filepath, suffix)) for suffix in compressors]
+    with ExitStack() as stack:
+        # A failed render must not leave its partial temp files behind
+        stack.callback(lambda: None if completed else [tmp.unlink(missing_ok=True) for tmp in temps])
+        completed = False
+        f = stack.enter_context(open(temps[0], 'wb', buffering=WRITE_BUFFER_SIZE))
+        sinks = {suffix: stack.enter_context(open(tmp, 'wb')) for suffix, tmp in zip(compressors, temps[1:])}
+
+        def write_variant(suffix, data):
+            if data:
+                variant_hashes[suffix].update(data)
+                variant_sizes[suffix] += len(data)
+                sinks[suffix].write(data)
+
+        render = write = squeeze = 0.0
+        clock = time.perf_counter
+        chunks = iter(chunks)
+        while True:
+            started = clock()
+            chunk = next(chunks, None)
+            rendered = clock()
+            render += rendered - started
+            if chunk is None:
+                break
+            data = chunk if isinstance(chunk, bytes) else encode_page(chunk)
+            h.update(data)
+            size += len(data)
+            f.write(data)
+            written = clock()
+            write += written - rendered
+            for suffix, (feed, _) in compressors.items():
+                write_variant(suffix, feed(data))
+            squeeze += clock() - written
+        started = clock()
+        for suffix, (_, finish) in compressors.items():
+            write_variant(suffix, finish())
+        squeeze += clock() - started
+        started = clock()
+        for sink in [f, *sinks.values()]:
+            fsync_file(sink)
+        write += clock() - started
+        completed = True
+        if timings is not None:
+            for stage, seconds in (("render", render), ("write", write), ("compress", squeeze)):
+                timings[stage] = timings.get(stage, 0.0) + seconds
+
+    digest = h.hexdigest()
+    changed = replace_if_changed(temp_path(filepath), filepath, digest, size)
+
+    variants = {}
+    for suffix in compressors:
+        path = variant_path(filepath, suffix)
+        if size >= COMPRESS_MIN_SIZE and variant_sizes[suffix] <= size * COMPRESS_MAX_RATIO:
+            replace_if_changed(temp_path(path), path, variant_hashes[suffix].hexdigest(),
+                               variant_sizes[suffix])
+            variants[suffix] = variant_sizes[suffix]
+        else:
+            # Not worth it: drop the variant so a stale copy is never served
+            temp_path(path).unlink()
+            path.unlink(missing_ok=True)
+            variants[suffix] = None
+    # Variants this build doesn't write would be stale copies of an older page
+    for suffix in VARIANT_SUFFIXES:
+        if suffix not in compressors:
+            variant_path(filepath, suffix).unlink(missing_ok=True)
+    return changed, digest, size, variants
+
+def variant_path(filepath, suffix):
+    return filepath.with_name(filepath.name + suffix)
+
+def compression_report(size, variants):
+    parts = []
+    for suffix, compressed in variants.items():
+        if compressed is None:
+            parts.append(f"{suffix} skipped")
+        else:
+            parts.append(f"{suffix} {compressed:,} B ({compressed / size:.0%})")
+    return f"{size:,} B → " + ", ".join(parts)
+
+@contextmanager
+def timed(timings, stage):
+    """Add the seconds spent in the with-block to timings[stage]."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - started
+
+def build_topic(topic_num, output_dir, entry, options):
+    """Render and write one topic's pages; returns (status, manifest entry, report).
+
+    options holds the build settings passed to generate_all_topics().
+    report carries per-build details back to the parent process, including
+    each page's filename and whether it changed, the number of Q&A items
+    and the seconds spent in each stage.
+    """
+    timings = {}
+    report = {"timings": timings}
+    topic = get_topic(topic_num)
+    with timed(timings, "load"):
+        qa_list = load_qa(topic)
+    report["items"] = len(qa_list)
+    compress = options.get("compress", False)
+    with timed(timings, "hash"):
+        inputs = topic_input_hash(topic, qa_list, options)
+
+    if options.get("incremental") and entry.get("inputs") == inputs and output_matches(output_dir, entry):
+        report["pages"] = [(page["filename"], "unchanged") for page in entry["pages"]]
+        return "unchanged", entry, report
+
+    filenames = []
+    page_entries = []
+    report["pages"] = []
+    stats = {}
+    for filename, page_qa, chunks in iter_topic_pages(topic, qa_list, options, stats):
+        filenames.append(filename)
+        filepath = output_dir / filename
+        changed, digest, size, variants = write_stream(filepath, chunks, compress, timings)
+        st = filepath.stat()
+        page_entry = {
+            "filename": filename,
+            "output": digest,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "questions": len(page_qa),
+        }
+        if compress:
+            page_entry["variants"] = variants
+        if "raw_size" in stats:
+            page_entry["raw_size"] = stats.pop("raw_size")
+        page_entries.append(page_entry)
+        report["pages"].append((filename, "created" if changed else "unchanged"))
+
+    # Pages left over from a build that split the topic into more pages
+    for page in entry.get("pages", []):
+        if page["filename"] not in filenames:
+            stale = output_dir / page["filename"]
+            for path in [stale] + [variant_path(stale, suffix) for suffix in VARIANT_SUFFIXES]:
+                path.unlink(missing_ok=True)
+            report["pages"].append((page["filename"], "removed"))
+
+    if options.get("fragment_cache"):
+        hits, misses, touched, added = get_fragment_cache(options["fragment_cache"]).drain()
+        report["fragments"] = {"hits": hits, "misses": misses, "touched": touched, "added": added}
+    status = "created" if any(s != "unchanged" for _, s in report["pages"]) else "unchanged"
+    return status, {"inputs": inputs, "pages": page_entries}, report
 
 # Generate all remaining topics
-def generate_all_topics():
-    topics = [
-        (5, generate_topic_05(), "05-cli-commands.html"),
-    ]
-    
-    for topic_num, content, filename in topics:
-        filepath = OUTPUT_DIR / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✅ Created: {filename}")
+def run_stage(pool, fn, arg_lists):
+    """Call fn once per argument tuple, on pool if given; exceptions are returned as results."""
+    if pool:
+        calls = [pool.submit(fn, *args).result for args in arg_lists]
+    else:
+        calls = [partial(fn, *args) for args in arg_lists]
+    outcomes = []
+    for call in calls:
+        try:
+            outcomes.append(call())
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+def topic_telemetry(filename, outcome):
+    """One topic's entry in the build report: status, item count, sizes and stage timings."""
+    if isinstance(outcome, Exception):
+        return {"topic": filename, "status": "failed", "error": f"{type(outcome).__name__}: {outcome}"}
+    status, entry, report = outcome
+    pages = entry["pages"]
+    telemetry = {
+        "topic": filename,
+        "status": status,
+        "items": report["items"],
+        "pages": len(pages),
+        "bytes": sum(page["size"] for page in pages),
+        "seconds": {stage: round(seconds, 6) for stage, seconds in report["timings"].items()},
+    }
+    if any("raw_size" in page for page in pages):
+        telemetry["raw_bytes"] = sum(page.get("raw_size", page["size"]) for page in pages)
+    variants = {}
+    for page in pages:
+        for suffix, compressed in page.get("variants", {}).items():
+            variants[suffix] = variants.get(suffix, 0) + (compressed or 0)
+    if variants:
+        telemetry["compressed_bytes"] = variants
+    if "fragments" in report:
+        telemetry["fragments"] = {key: report["fragments"][key] for key in ("hits", "misses")}
+    return telemetry
+
+def write_build_report(path, options, jobs, timings, topic_reports, failures, dedupe_report=None):
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "jobs": jobs,
+        "options": {name: options.get(name) for name in OUTPUT_OPTIONS + ("incremental",)},
+        "seconds": {stage: round(seconds, 6) for stage, seconds in timings.items()},
+        "topics": topic_reports,
+        "failures": [[filename, str(error)] for filename, error in failures],
+    }
+    if dedupe_report:
+        report["shared_fragments"] = dedupe_report
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(path, (json.dumps(report, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
+    print(f"📊 Report: {path}")
+
+def generate_all_topics(output_dir=OUTPUT_DIR, incremental=False, jobs=1, external_assets=False,
+                        compress=False, minify=False, lazy_answers=False, topics=None,
+                        fragment_cache=False, per_page=None, offline=False, validate=False,
+                        report_path=None, dedupe=False, export=None):
+    """Build the site into output_dir; the options are those of the command-line flags.
+
+    topics limits the build to those topic numbers, though the search index
+    always covers every topic. Builds of the same output_dir wait for each
+    other (see build_lock), including the export at the end, and every file
+    is replaced atomically, so readers never see a partly written page.
+
+    Returns the list of (filename, error) pairs for topics that failed.
+    """
+    started = time.perf_counter()
+    timings = {}
+    topic_reports = []
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with build_lock(output_dir):
+        manifest = load_manifest(output_dir)
+        failures = []
+        if compress and brotli is None:
+            print("⚠️  brotli is not installed; writing .gz variants only")
+        options = {
+            "incremental": incremental,
+            "assets": write_shared_assets(output_dir, compress) if external_assets else None,
+            "compress": compress,
+            "minify": minify,
+            "lazy_answers": lazy_answers,
+            "fragment_cache": output_dir / FRAGMENT_CACHE_NAME if fragment_cache else None,
+            "per_page": per_page,
+            "offline": offline,
+            "dedupe": dedupe,
+            "includes": None,
+        }
+        dedupe_report = None
+        if dedupe:
+            with timed(timings, "dedupe"):
+                answers = (a for topic in generated_topics() for _, a in load_qa(topic))
+                options["includes"], dedupe_report = write_includes(output_dir, answers, minify)
+            print(f"🧬 Shared fragments: {dedupe_report['fragments']} stored once for "
+                  f"{dedupe_report['references']} references, saved {dedupe_report['saved_bytes']:,} B "
+                  f"({dedupe_report['net_saved_bytes']:,} B net of include files)")
+        else:
+            # Drop include files left over from an earlier dedupe build
+            write_includes(output_dir, [])
+        if not external_assets:
+            remove_unused_assets(output_dir)
+
+        selected = [topic for topic in generated_topics() if topics is None or topic["num"] in topics]
+
+        def build_args(topic):
+            return topic["num"], output_dir, manifest.get(topic["filename"], {}), options
+
+        with ExitStack() as stack:
+            # One pool for the whole build: rendering, then validation
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs)) if jobs > 1 else None
+            with timed(timings, "topics"):
+                outcomes = run_stage(pool, build_topic, [build_args(topic) for topic in selected])
+
+            # Report in registry order so output is the same whatever finishes first
+            for topic, outcome in zip(selected, outcomes):
+                filename = topic["filename"]
+                topic_reports.append(topic_telemetry(filename, outcome))
+                if isinstance(outcome, Exception):
+                    failures.append((filename, outcome))
+                    print(f"❌ Failed: {filename}: {type(outcome).__name__}: {outcome}")
+                    continue
+                status, entry, report = outcome
+                manifest[filename] = entry
+                pages = {page["filename"]: page for page in entry["pages"]}
+                for page_name, page_status in report["pages"]:
+                    if page_status == "created":
+                        print(f"✅ Created: {page_name}")
+                    elif page_status == "removed":
+                        print(f"🗑️  Removed: {page_name}")
+                        continue
+                    else:
+                        print(f"⏭️  Unchanged: {page_name}")
+                    page = pages[page_name]
+                    if "raw_size" in page:
+                        saved = page["raw_size"] - page["size"]
+                        print(f"   ✂️  minified {page['raw_size']:,} B → {page['size']:,} B "
+                              f"(saved {saved:,} B, {saved / page['raw_size']:.0%})")
+                    if compress and "variants" in page:
+                        print(f"   🗜️  {compression_report(page['size'], page['variants'])}")
+                if "fragments" in report:
+                    fragments = report["fragments"]
+                    get_fragment_cache(options["fragment_cache"]).merge(fragments["touched"], fragments["added"])
+                    print(f"   🧩 fragments: {fragments['hits']} cached, {fragments['misses']} rendered")
+
+            save_manifest(output_dir, manifest)
+            if fragment_cache:
+                get_fragment_cache(options["fragment_cache"]).save()
+            if not failures:
+                with timed(timings, "static_pages"):
+                    write_static_pages(output_dir, compress)
+                with timed(timings, "search_index"):
+                    write_search_index(output_dir, [(topic, load_qa(topic)) for topic in generated_topics()],
+                                       per_page, compress)
+                with timed(timings, "hub"):
+                    write_hub(output_dir, per_page, offline, compress)
+                if offline:
+                    with timed(timings, "service_worker"):
+                        write_service_worker(output_dir, manifest, options["assets"])
+                if validate:
+                    with timed(timings, "validate"):
+                        failures += validate_site(output_dir, manifest, options["assets"], pool)
+            if not failures:
+                # Only a complete (and, if asked, valid) site is worth deploying
+                with timed(timings, "deploy_manifest"):
+                    write_deploy_manifest(output_dir, manifest)
+                if export:
+                    with timed(timings, "export"):
+                        export_site(output_dir, export)
+    timings["total"] = time.perf_counter() - started
+    if report_path:
+        write_build_report(report_path, options, jobs, timings, topic_reports, failures, dedupe_report)
+    return failures
+
+# Library API
+# Render pages without writing any output, so a long-running service can
+# call these concurrently (from threads or tasks) and keep the results
+# wherever it likes. Content is still read through load_qa(), which caches
+# parsed files and the packed corpus per process.
+def page_streams(topics=None, external_assets=False, minify=False, lazy_answers=False,
+                 per_page=None, offline=False):
+    """Yield (filename, byte chunks) for every page of the selected topics.
+
+    topics is an iterable of topic numbers (default: every generated topic).
+    With external_assets the shared CSS/JS files come first, under the
+    fingerprinted names the pages link to. Chunks are produced lazily, so a
+    page is only rendered as far as its consumer reads it.
+    """
+    selected = generated_topics()
+    if topics is not None:
+        selected = [get_topic(num) for num in topics]
+        for topic in selected:
+            if not is_generated(topic):
+                raise ValueError(f"Topic {topic['num']} is a hand-written page and cannot be rendered")
+    assets = None
+    if external_assets:
+        assets = {}
+        for kind, name, data in shared_assets():
+            assets[kind] = name
+            yield name, iter([data])
+    options = {
+        "assets": assets,
+        "minify": minify,
+        "lazy_answers": lazy_answers,
+        "per_page": per_page,
+        "offline": offline,
+    }
+    for topic in selected:
+        for filename, _, chunks in iter_topic_pages(topic, load_qa(topic), options):
+            yield filename, map(encode_page, chunks)
+
+def render_topics(writer, topics=None, **options):
+    """Render the selected topics, calling writer(filename, data) for every chunk in order.
+
+    options are those of page_streams().
+    """
+    for filename, chunks in page_streams(topics, **options):
+        for data in chunks:
+            writer(filename, data)
+
+def render_to_memory(topics=None, **options):
+    """Render the selected topics into memory; returns {filename: page bytes}."""
+    return {filename: b"".join(chunks) for filename, chunks in page_streams(topics, **options)}
+
+async def render_topics_async(sink, topics=None, **options):
+    """Like render_topics(), awaiting sink(filename, data) for every chunk.
+
+    The event loop gets control back after each chunk, so long topics don't
+    stall other requests.
+    """
+    for filename, chunks in page_streams(topics, **options):
+        for data in chunks:
+            await sink(filename, data)
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate GitHub Copilot Q&A topic pages")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR,
+                        help="directory to write pages to (default: current directory)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="skip topics whose content and templates are unchanged since the last build")
+    parser.add_argument("-j", "--jobs", type=positive_int, default=1,
+                        help="number of worker processes used to render topics (default: 1)")
+    parser.add_argument("--external-assets", action="store_true",
+                        help="link shared, fingerprinted CSS/JS files instead of inlining them in every page")
+    parser.add_argument("--minify", action="store_true",
+                        help="collapse insignificant whitespace in the generated pages")
+    parser.add_argument("--lazy-answers", action="store_true",
+                        help="ship answers collapsed and render them on first expand")
+    parser.add_argument("--per-page", type=positive_int, metavar="N",
+                        help="split topics with more than N questions into linked pages")
+    parser.add_argument("--dedupe-fragments", action="store_true",
+                        help="store answer fragments repeated across topics once, as cacheable include files")
+    parser.add_argument("--offline", action="store_true",
+                        help="write a service worker and precache manifest so the site works offline")
+    parser.add_argument("--fragment-cache", action="store_true",
+                        help="reuse rendered Q&A fragments from previous builds")
+    parser.add_argument("--compress", action="store_true",
+                        help="also write precompressed .html.gz (and .html.br if brotli is installed) variants")
+    parser.add_argument("--validate", action="store_true",
+                        help="check links, anchors, navigation and duplicate IDs across the built site")
+    parser.add_argument("--report", type=Path, metavar="PATH",
+                        help="write per-topic and per-stage timings and sizes to this JSON file")
+    parser.add_argument("--profile", type=Path, metavar="PATH",
+                        help="profile the build with cProfile and dump the stats to PATH "
+                             "(readable by pstats, snakeviz or flameprof)")
+    parser.add_argument("--export", type=Path, metavar="PATH",
+                        help="after building, export the site to PATH: a single-file .html bundle "
+                             "or a reproducible .zip/.tar.gz archive")
+    parser.add_argument("--pack-corpus", action="store_true",
+                        help=f"pack the content into content/{CORPUS_NAME} for memory-mapped loading, then exit")
+    parser.add_argument("--on-demand", type=int, metavar="PORT",
+                        help="instead of building, serve the site on PORT and render pages from the "
+                             "content as they are requested")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="interface --on-demand listens on (default: 127.0.0.1)")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and rebuild topics whose content files change")
+    parser.add_argument("--serve", type=int, metavar="PORT",
+                        help="with --watch, serve the output on localhost:PORT and live-reload open pages")
+    args = parser.parse_args(argv)
+    if args.export and not args.export.name.endswith(EXPORT_FORMATS):
+        parser.error(f"argument --export: unsupported format {args.export.name!r} "
+                     f"(use {', '.join(EXPORT_FORMATS)})")
+    return args
 
 if __name__ == "__main__":
-    generate_all_topics()
+    args = parse_args()
+    build_options = dict(incremental=args.incremental, jobs=args.jobs,
+                         external_assets=args.external_assets, compress=args.compress,
+                         minify=args.minify, lazy_answers=args.lazy_answers,
+                         fragment_cache=args.fragment_cache, per_page=args.per_page, offline=args.offline,
+                         validate=args.validate, report_path=args.report,
+                         dedupe=args.dedupe_fragments, export=args.export)
+    if args.pack_corpus:
+        write_corpus()
+        sys.exit(0)
+    if args.on_demand is not None:
+        from serve_topics import run_server
+        run_server(args.host, args.on_demand, external_assets=args.external_assets,
+                   minify=args.minify, lazy_answers=args.lazy_answers, per_page=args.per_page)
+        sys.exit(0)
+    if args.watch or args.serve is not None:
+        from watch_topics import watch_topics
+        watch_topics(args.output_dir, serve_port=args.serve, **build_options)
+        sys.exit(0)
+    if args.profile:
+        if args.jobs > 1:
+            print("⚠️  --profile only sees the main process; use -j 1 to profile rendering")
+        profiler = cProfile.Profile()
+        failures = profiler.runcall(generate_all_topics, args.output_dir, **build_options)
+        profiler.dump_stats(args.profile)
+        print(f"🔬 Profile: {args.profile}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(PROFILE_TOP)
+    else:
+        failures = generate_all_topics(args.output_dir, **build_options)
+    if failures:
+        print(f"\n💥 Build failed: {len(failures)} problem(s)")
+        sys.exit(1)
     print("\n🎉 Topic generation complete!")
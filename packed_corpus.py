@@ -0,0 +1,113 @@
+"""
+GitHub Copilot Q&A Generator - packed corpus format
+A binary copy of the Q&A content that readers memory-map and slice on
+demand instead of parsing JSON Lines. generate_topics.py --pack-corpus
+writes it, and load_qa() prefers it while it is up to date.
+"""
+
+import mmap
+import struct
+from collections.abc import Sequence
+
+# Packed corpus: a header, one table entry per topic, then per topic an
+# offset table of 2n+1 absolute positions followed by the UTF-8 questions
+# and answers it delimits (question i is off[2i]:off[2i+1], its answer
+# off[2i+1]:off[2i+2]). Each topic entry records the (mtime, size) of the
+# JSON Lines file it was packed from, so stale sections are ignored.
+CORPUS_MAGIC = b"QAPK"
+CORPUS_VERSION = 1
+CORPUS_HEADER = struct.Struct("<4sII")  # magic, version, topic count
+CORPUS_TOPIC = struct.Struct("<IIqqQ")  # topic num, item count, source mtime_ns, source size, table position
+CORPUS_BOUNDS = struct.Struct("<3Q")
+
+class PackedTopic(Sequence):
+    """One topic of a PackedCorpus, as a read-only sequence of (question, answer) pairs.
+
+    Entries are decoded from the memory map only when they are accessed;
+    raw() returns them as zero-copy memoryviews instead.
+    """
+
+    def __init__(self, buf, count, table):
+        self.buf = buf
+        self.count = count
+        self.table = table
+
+    def __len__(self):
+        return self.count
+
+    def raw(self, index):
+        start, middle, end = CORPUS_BOUNDS.unpack_from(self.buf, self.table + 16 * index)
+        return self.buf[start:middle], self.buf[middle:end]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        question, answer = self.raw(index)
+        return str(question, "utf-8"), str(answer, "utf-8")
+
+class PackedCorpus:
+    """Read-only, memory-mapped view of a corpus written by pack_corpus().
+
+    Opening it only reads the header and topic table; the OS pages in the
+    sections of the topics that are actually used.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buf = memoryview(self.map)
+        magic, version, count = CORPUS_HEADER.unpack_from(self.buf, 0)
+        if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+            raise ValueError(f"{path}: not a version {CORPUS_VERSION} Q&A corpus")
+        self.topics = {}
+        for i in range(count):
+            num, items, mtime_ns, size, table = CORPUS_TOPIC.unpack_from(
+                self.buf, CORPUS_HEADER.size + i * CORPUS_TOPIC.size)
+            # The last offset closes the last answer; past the end means the file was cut short
+            if table + 16 * items + 8 > len(self.buf) or \
+                    struct.unpack_from("<Q", self.buf, table + 16 * items)[0] > len(self.buf):
+                raise ValueError(f"{path}: topic {num} is truncated")
+            self.topics[num] = ((mtime_ns, size), items, table)
+
+    def source_signature(self, topic_num):
+        """(mtime, size) of the source file a topic was packed from."""
+        return self.topics[topic_num][0]
+
+    def topic(self, topic_num):
+        _, items, table = self.topics[topic_num]
+        return PackedTopic(self.buf, items, table)
+
+def pack_corpus(f, topics):
+    """Write a packed corpus to f, a binary file positioned at its start.
+
+    topics is a sequence of (topic num, source signature, qa_list) where
+    qa_list is any iterable of (question, answer) pairs, e.g. a load_qa()
+    result or a Python literal list of tuples.
+    """
+    sections = []
+    for num, signature, qa_list in topics:
+        sections.append((num, signature or (0, 0),
+                         [part.encode("utf-8") for pair in qa_list for part in pair]))
+    position = CORPUS_HEADER.size + CORPUS_TOPIC.size * len(sections)
+    entries = []
+    tables = []
+    for num, (mtime_ns, size), blobs in sections:
+        position += -position % 8  # keep offset tables 8-byte aligned
+        table = position
+        offsets = [table + 8 * (len(blobs) + 1)]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+        entries.append(CORPUS_TOPIC.pack(num, len(blobs) // 2, mtime_ns, size, table))
+        tables.append((table, offsets))
+        position = offsets[-1]
+
+    f.write(CORPUS_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, len(sections)))
+    f.writelines(entries)
+    for (table, offsets), (_, _, blobs) in zip(tables, sections):
+        f.write(b"\0" * (table - f.tell()))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.writelines(blobs)
@@ -0,0 +1,122 @@
+// Question-level search for the hub page. The index is generated by
+// generate_topics.py and only fetched the first time the search box is used.
+(function () {
+    var MAX_RESULTS = 10;
+    var MAX_PREFIX_TERMS = 50;
+    var input = document.getElementById('searchInput');
+    var results = document.getElementById('searchResults');
+    if (!input || !results) return;
+
+    var index = null;
+    var terms = null;
+    var stopWords = null;
+    var loading = null;
+
+    function load() {
+        if (!loading) {
+            loading = fetch('search-index.json')
+                .then(function (response) {
+                    if (!response.ok) throw new Error(response.status);
+                    return response.json();
+                })
+                .then(function (data) {
+                    index = data;
+                    terms = Object.keys(data.terms).sort();
+                    stopWords = new Set(data.stop);
+                })
+                .catch(function () { loading = null; });
+        }
+        return loading;
+    }
+
+    function tokenize(text) {
+        return text.toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+    }
+
+    // Terms starting with prefix, found by binary search over the sorted term list
+    function prefixTerms(prefix) {
+        var lo = 0, hi = terms.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1;
+            if (terms[mid] < prefix) lo = mid + 1; else hi = mid;
+        }
+        var found = [];
+        for (var i = lo; i < terms.length && found.length < MAX_PREFIX_TERMS && terms[i].indexOf(prefix) === 0; i++) {
+            found.push(terms[i]);
+        }
+        return found;
+    }
+
+    function search(query) {
+        // Stop words are not indexed, so drop them like the indexer does; a
+        // last word still being typed may yet become a longer indexed word
+        var typing = /[\p{L}\p{N}]$/u.test(query);
+        var tokens = tokenize(query);
+        tokens = tokens.filter(function (token, i) {
+            return !stopWords.has(token) || (typing && i === tokens.length - 1);
+        });
+        var scores = null;
+        tokens.forEach(function (token, i) {
+            // The last word is still being typed, so match it as a prefix
+            var words = i === tokens.length - 1 ? prefixTerms(token) : [token];
+            var matched = new Map();
+            words.forEach(function (word) {
+                var postings = index.terms[word];
+                if (!postings) return;
+                for (var j = 0; j < postings.length; j += 2) {
+                    matched.set(postings[j], (matched.get(postings[j]) || 0) + postings[j + 1]);
+                }
+            });
+            if (scores === null) {
+                scores = matched;
+            } else {
+                var both = new Map();
+                matched.forEach(function (score, doc) {
+                    if (scores.has(doc)) both.set(doc, scores.get(doc) + score);
+                });
+                scores = both;
+            }
+        });
+        if (!scores) return [];
+        return Array.from(scores).sort(function (a, b) {
+            return b[1] - a[1] || a[0] - b[0];
+        }).slice(0, MAX_RESULTS);
+    }
+
+    function render(hits, query) {
+        results.textContent = '';
+        if (!hits.length) {
+            var empty = document.createElement('p');
+            empty.className = 'search-empty';
+            empty.textContent = 'No questions match "' + query + '"';
+            results.appendChild(empty);
+            return;
+        }
+        hits.forEach(function (hit) {
+            var doc = index.docs[hit[0]];
+            var page = index.pages[doc[0]];
+            var link = document.createElement('a');
+            link.className = 'search-hit';
+            link.href = page[0] + '#' + doc[2];
+            var question = document.createElement('strong');
+            question.textContent = doc[1];
+            var topic = document.createElement('span');
+            topic.textContent = page[1];
+            link.appendChild(question);
+            link.appendChild(topic);
+            results.appendChild(link);
+        });
+    }
+
+    input.addEventListener('focus', load);
+    input.addEventListener('input', function () {
+        var query = input.value;
+        if (!query.trim()) {
+            results.textContent = '';
+            return;
+        }
+        load().then(function () {
+            if (index && input.value === query) render(search(query), query);
+        });
+    });
+})();
@@ -0,0 +1,293 @@
+"""
+GitHub Copilot Q&A Generator - on-demand server
+Serves the whole site straight from the Q&A content over HTTP/1.1,
+rendering pages on first request and keeping them in memory. Run through
+generate_topics.py --on-demand PORT [--host HOST].
+"""
+
+import re
+import asyncio
+import hashlib
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from generate_topics import (
+    ANCHORS_NAME, COMPRESS_MAX_RATIO, COMPRESS_MIN_SIZE, HUB_FILENAME, SEARCH_INDEX_NAME,
+    SEARCH_SCRIPT_NAME, SITE_DIR, TOPICS, encode_page, file_signature, generated_topics,
+    is_generated, load_qa, new_compressors, page_streams, paginate, render_hub, search_files,
+    shared_assets, source_signatures,
+)
+
+# Rendered (and compressed) responses kept in memory, least-recently-used first out
+SERVER_CACHE_MAX_BYTES = 32 << 20
+# Seconds an idle keep-alive connection is kept open
+SERVER_IDLE_TIMEOUT = 15
+SERVER_MAX_HEADER_BYTES = 16 << 10
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".json": "application/json",
+}
+CONTENT_ENCODINGS = {".br": "br", ".gz": "gzip"}
+# Served in this order when the client accepts several, whatever order it lists them in
+ENCODING_PREFERENCE = ("br", "gzip")
+RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)$")
+HTTP_REASONS = {200: "OK", 206: "Partial Content", 304: "Not Modified", 400: "Bad Request",
+                404: "Not Found", 405: "Method Not Allowed", 416: "Range Not Satisfiable",
+                500: "Internal Server Error"}
+
+class ResponseCache:
+    """Size-bounded LRU of rendered responses, each tagged with the source signature it was built from."""
+
+    def __init__(self, max_bytes=SERVER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict()
+
+    def get(self, name, signature):
+        entry = self.entries.get(name)
+        if entry is None or entry["signature"] != signature:
+            return None
+        self.entries.move_to_end(name)
+        return entry
+
+    def put(self, name, entry):
+        old = self.entries.pop(name, None)
+        if old:
+            self.size -= old["bytes"]
+        self.entries[name] = entry
+        self.size += entry["bytes"]
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= evicted["bytes"]
+
+def accepted_encodings(header):
+    """Content codings a client accepts, from its Accept-Encoding header."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        params = params.strip()
+        try:
+            if params.startswith("q=") and float(params[2:]) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+def parse_range(header, size):
+    """(start, end) of a single "bytes=" range; None to ignore the header, ValueError if unsatisfiable."""
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None  # malformed or several ranges: serve the whole body
+    first, last = match.groups()
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+class TopicServer:
+    """Serves the whole site straight from the Q&A content, without building files.
+
+    Pages, the hub and the search files are rendered on first request in a
+    worker thread (once, however many requests are waiting for them) and
+    kept in a ResponseCache together with their gzip/brotli variants. Each
+    request re-checks the content files' signatures, so edits show up on the
+    next request. Hand-written pages are served from SITE_DIR the same way.
+    options are those of page_streams().
+    """
+
+    def __init__(self, cache_bytes=SERVER_CACHE_MAX_BYTES, **options):
+        self.options = options
+        self.per_page = options.get("per_page")
+        self.cache = ResponseCache(cache_bytes)
+        self.pending = {}
+        self.assets = {name: data for _, name, data in shared_assets()} if options.get("external_assets") else {}
+
+    def resource(self, name):
+        """(source signature, render function) for a site file, or None if there is no such file."""
+        if name in self.assets:
+            return "asset", partial(self.assets.get, name)
+        if name in (HUB_FILENAME, SEARCH_INDEX_NAME, SEARCH_SCRIPT_NAME, ANCHORS_NAME):
+            signature = (tuple(sorted(source_signatures().items())),
+                         tuple(static_signature(topic["filename"]) for topic in TOPICS if not is_generated(topic)))
+            return signature, partial(self.render_site_file, name)
+        for topic in TOPICS:
+            if not is_generated(topic):
+                signature = static_signature(name) if name == topic["filename"] else None
+                if signature:
+                    return signature, (SITE_DIR / name).read_bytes
+                continue
+            filenames = [filename for filename, _ in paginate(topic, load_qa(topic), self.per_page)]
+            if name in filenames:
+                return source_signatures().get(topic["num"], "qa"), partial(self.render_page, topic, name)
+        return None
+
+    def render_page(self, topic, name):
+        for filename, chunks in page_streams([topic["num"]], **self.options):
+            if filename == name:
+                return b"".join(chunks)
+        raise KeyError(name)
+
+    def render_site_file(self, name):
+        if name == HUB_FILENAME:
+            return encode_page(render_hub(SITE_DIR, self.per_page))
+        return search_files([(topic, load_qa(topic)) for topic in generated_topics()], self.per_page)[name]
+
+    @staticmethod
+    def build_entry(signature, render):
+        body = render()
+        variants = {}
+        if len(body) >= COMPRESS_MIN_SIZE:
+            for suffix, (feed, finish) in new_compressors().items():
+                data = feed(body) + finish()
+                if len(data) <= len(body) * COMPRESS_MAX_RATIO:
+                    variants[CONTENT_ENCODINGS[suffix]] = data
+        return {
+            "signature": signature,
+            "body": body,
+            "etag": hashlib.sha256(body).hexdigest()[:20],
+            "variants": variants,
+            "bytes": len(body) + sum(len(data) for data in variants.values()),
+        }
+
+    async def lookup(self, name):
+        """The cached response for name, rendered first if it is missing or stale."""
+        found = self.resource(name)
+        if not found:
+            return None
+        signature, render = found
+        entry = self.cache.get(name, signature)
+        if entry:
+            return entry
+        key = (name, signature)
+        task = self.pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(self.build_entry, signature, render))
+            self.pending[key] = task
+
+            def done(task):
+                self.pending.pop(key, None)
+                if not task.cancelled() and task.exception() is None:
+                    self.cache.put(name, task.result())
+            task.add_done_callback(done)
+        # Shielded so one client hanging up doesn't cancel the render for the others
+        return await asyncio.shield(task)
+
+    async def respond(self, method, target, headers):
+        """Return (status, headers, body) for one request."""
+        if method not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD"}, b""
+        name = unquote(urlsplit(target).path).lstrip("/") or HUB_FILENAME
+        entry = await self.lookup(name) if "/" not in name else None
+        if entry is None:
+            return 404, {"Content-Type": "text/plain; charset=utf-8"}, b"Not found\n"
+
+        response = {
+            "Content-Type": CONTENT_TYPES.get(Path(name).suffix, "application/octet-stream"),
+            "Cache-Control": "no-cache",
+            "Accept-Ranges": "bytes",
+            "Vary": "Accept-Encoding",
+        }
+        body = entry["body"]
+        etag = f'"{entry["etag"]}"'
+        byte_range = None
+        if "range" in headers and headers.get("if-range", etag) == etag:
+            try:
+                byte_range = parse_range(headers["range"], len(body))
+            except ValueError:
+                return 416, dict(response, **{"Content-Range": f"bytes */{len(body)}"}), b""
+        if byte_range is None:
+            # Ranges address the identity bytes; whole responses may be compressed
+            accepted = accepted_encodings(headers.get("accept-encoding", ""))
+            for coding in ENCODING_PREFERENCE:
+                if coding in accepted and coding in entry["variants"]:
+                    body = entry["variants"][coding]
+                    etag = f'"{entry["etag"]}-{coding}"'
+                    response["Content-Encoding"] = coding
+                    break
+        response["ETag"] = etag
+        if_none_match = [tag.strip() for tag in headers.get("if-none-match", "").split(",")]
+        if etag in if_none_match or "*" in if_none_match:
+            return 304, response, b""
+        if byte_range:
+            start, end = byte_range
+            response["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+            return 206, response, body[start:end + 1]
+        return 200, response, body
+
+    async def handle(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until it closes or idles out."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), SERVER_IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ")
+                except ValueError:
+                    await self.send(writer, "GET", 400, {}, b"", False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    field, sep, value = line.partition(":")
+                    if sep:
+                        headers[field.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                # Request bodies are never read, so a connection that sent one can't be reused
+                keep_alive = keep_alive and "content-length" not in headers and "transfer-encoding" not in headers
+                try:
+                    status, response, body = await self.respond(method, target, headers)
+                except Exception as exc:
+                    print(f"❌ Failed: {target}: {type(exc).__name__}: {exc}")
+                    status, response, body = 500, {"Content-Type": "text/plain; charset=utf-8"}, b"Error\n"
+                await self.send(writer, method, status, response, body, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def send(writer, method, status, headers, body, keep_alive):
+        headers = dict(headers, Connection="keep-alive" if keep_alive else "close")
+        # A 304 has no body, and its Content-Length would have to be the 200's
+        if status != 304:
+            headers["Content-Length"] = str(len(body))
+        lines = [f"HTTP/1.1 {status} {HTTP_REASONS[status]}"]
+        lines += [f"{field}: {value}" for field, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if method != "HEAD":
+            writer.write(body)
+        await writer.drain()
+
+def static_signature(name):
+    """(mtime, size) of a hand-written page in SITE_DIR, or None if it doesn't exist."""
+    return file_signature(SITE_DIR / name)
+
+async def serve_topics(host="127.0.0.1", port=8000, **options):
+    """Run a TopicServer on host:port until cancelled; options are those of page_streams()."""
+    site = TopicServer(**options)
+    server = await asyncio.start_server(site.handle, host, port, limit=SERVER_MAX_HEADER_BYTES, backlog=1024)
+    print(f"🌐 Serving on demand: http://{host}:{server.sockets[0].getsockname()[1]}/")
+    async with server:
+        await server.serve_forever()
+
+def run_server(host="127.0.0.1", port=8000, **options):
+    """Run serve_topics() until Ctrl+C."""
+    try:
+        asyncio.run(serve_topics(host, port, **options))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped serving")
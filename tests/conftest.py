@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The generator is a set of scripts in the repository root, not a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_topics  # noqa: E402
+
+@pytest.fixture
+def build(tmp_path):
+    """Build the site into a fresh directory; returns (output_dir, failures), same dir on each call."""
+    output_dir = tmp_path / "site"
+
+    def run(**options):
+        return output_dir, generate_topics.generate_all_topics(output_dir, **options)
+    return run
@@ -0,0 +1,36 @@
+import re
+
+import generate_topics
+from generate_topics import ANCHOR_SLUG_LENGTH, build_anchor_table, question_anchor, qa_item
+
+TOPIC = {"num": 1, "filename": "01-test.html", "title": "Test topic"}
+QA = [(f"Question number {i}?", f"Answer {i}.") for i in range(5)]
+
+def test_anchor_is_a_slug_plus_a_hash_of_the_text():
+    anchor = question_anchor("What is <code>gh copilot</code> &amp; why?")
+    assert re.fullmatch(r"q-what-is-gh-copilot-why-[0-9a-f]{6}", anchor)
+    assert anchor == question_anchor("What is <code>gh copilot</code> &amp; why?")
+    assert anchor != question_anchor("What is gh copilot & why not?")
+
+def test_anchor_slug_is_cut_at_a_word_boundary():
+    anchor = question_anchor("word " * 40)
+    slug = anchor[len("q-"):-len("-123456")]
+    assert len(slug) <= ANCHOR_SLUG_LENGTH
+    assert slug.split("-") == ["word"] * len(slug.split("-"))
+
+def test_anchor_without_slug_characters():
+    assert re.fullmatch(r"q-[0-9a-f]{6}", question_anchor("¿?"))
+
+def test_rendered_questions_carry_their_anchor():
+    assert f'id="{question_anchor("Why?")}"' in qa_item("Why?", "Because.")
+    assert f'id="{question_anchor("Why?")}"' in qa_item("Why?", "Because.", 0)
+
+def test_anchor_table_maps_anchors_to_page_and_offset():
+    table = build_anchor_table([(TOPIC, QA)], per_page=2)
+    assert table["pages"] == ["01-test.html", "01-test-2.html", "01-test-3.html"]
+    assert table["anchors"] == {question_anchor(q): [i // 2, i % 2] for i, (q, _) in enumerate(QA)}
+
+def test_anchors_are_unique_across_the_content():
+    anchors = [question_anchor(q) for topic in generate_topics.generated_topics()
+               for q, _ in generate_topics.load_qa(topic)]
+    assert len(anchors) == len(set(anchors))
@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+
+import pytest
+
+import generate_topics
+from generate_topics import BUILD_LOCK_NAME, break_stale_lock, build_lock, exclusive_file_lock, write_stream
+
+def run_in_threads(target, count=4):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+@pytest.mark.parametrize("flock", [True, False])
+def test_build_lock_serialises_builders(tmp_path, monkeypatch, flock):
+    if not flock:
+        monkeypatch.setattr(generate_topics, "fcntl", None)
+    elif generate_topics.fcntl is None:
+        pytest.skip("flock() is not available")
+    inside = []
+    overlaps = []
+
+    def builder():
+        for _ in range(10):
+            with build_lock(tmp_path):
+                inside.append(1)
+                overlaps.append(len(inside) > 1)
+                time.sleep(0.001)
+                inside.pop()
+    run_in_threads(builder)
+    assert len(overlaps) == 40 and not any(overlaps)
+
+def test_build_lock_is_reentrant_in_one_thread(tmp_path):
+    with build_lock(tmp_path):
+        with build_lock(tmp_path):
+            pass
+
+def test_stale_lock_file_is_broken(tmp_path, capsys):
+    path = tmp_path / BUILD_LOCK_NAME
+    path.write_text("1\n")
+    old = time.time() - generate_topics.BUILD_LOCK_STALE_SECONDS - 60
+    os.utime(path, (old, old))
+    with exclusive_file_lock(path, tmp_path):
+        assert path.read_text() == f"{os.getpid()}\n"
+    assert "Breaking stale build lock" in capsys.readouterr().out
+    assert list(tmp_path.iterdir()) == []
+
+def test_breaking_a_stale_lock_leaves_a_newer_lock_alone(tmp_path):
+    # Another waiter broke the stale lock and took a fresh one since it was looked at
+    path = tmp_path / BUILD_LOCK_NAME
+    path.write_text("stale\n")
+    stale = path.stat()
+    path.unlink()
+    path.write_text("live\n")
+    live = path.stat()
+
+    break_stale_lock(path, stale, 7200)
+    assert path.read_text() == "live\n" and generate_topics.same_file(path.stat(), live)
+    assert [p.name for p in tmp_path.iterdir()] == [BUILD_LOCK_NAME]
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_failed_write_leaves_the_old_file_and_no_temp_files(tmp_path, compress):
+    target = tmp_path / "page.html"
+    target.write_bytes(b"old")
+
+    def chunks():
+        yield "<p>new</p>" * 500
+        raise RuntimeError("render failed")
+    with pytest.raises(RuntimeError):
+        write_stream(target, chunks(), compress)
+    assert target.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["page.html"]
+
+def test_concurrent_builds_leave_a_complete_site(tmp_path):
+    output_dir = tmp_path / "site"
+    failures = []
+    run_in_threads(lambda: failures.extend(generate_topics.generate_all_topics(output_dir, compress=True)), 3)
+    assert not failures
+    assert not list(output_dir.glob("*.tmp")) and not list(output_dir.glob(".*.tmp"))
+    page = generate_topics.load_manifest(output_dir)["05-cli-commands.html"]["pages"][0]
+    assert generate_topics.file_hash(output_dir / page["filename"]) == page["output"]
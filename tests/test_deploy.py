@@ -0,0 +1,40 @@
+import json
+
+import generate_topics
+from generate_topics import DEPLOY_MANIFEST_NAME, deploy_diff
+
+def deploy_manifest(output_dir):
+    return json.loads((output_dir / DEPLOY_MANIFEST_NAME).read_text(encoding="utf-8"))
+
+def test_deploy_diff():
+    previous = {"a.html": {"sha256": "1"}, "b.html": {"sha256": "2"}, "c.html": {"sha256": "3"}}
+    files = {"a.html": {"sha256": "1"}, "b.html": {"sha256": "9"}, "d.html": {"sha256": "4"}}
+    assert deploy_diff(previous, files) == {"added": ["d.html"], "changed": ["b.html"], "removed": ["c.html"]}
+
+def test_first_build_adds_the_whole_site(build):
+    output_dir, _ = build()
+    manifest = deploy_manifest(output_dir)
+    assert manifest["previous"] is None
+    assert manifest["diff"]["added"] == sorted(manifest["files"])
+    # Hand-written pages are part of a site built outside the repository
+    assert {"index.html", "01-audit-log-events.html", "05-cli-commands.html"} <= set(manifest["files"])
+    page = manifest["files"]["05-cli-commands.html"]
+    assert page["size"] == (output_dir / "05-cli-commands.html").stat().st_size
+    assert page["sha256"] == generate_topics.file_hash(output_dir / "05-cli-commands.html")
+
+def test_unchanged_rebuild_has_an_empty_diff(build):
+    output_dir, _ = build()
+    first = deploy_manifest(output_dir)
+    build()
+    second = deploy_manifest(output_dir)
+    assert second["diff"] == {"added": [], "changed": [], "removed": []}
+    assert second["previous"] == first["build"] == second["build"]
+
+def test_diff_lists_added_changed_and_removed_files(build):
+    output_dir, _ = build(per_page=10)
+    build(minify=True, compress=True)
+    diff = deploy_manifest(output_dir)["diff"]
+    assert diff["removed"] == ["05-cli-commands-2.html", "05-cli-commands-3.html"]
+    assert "05-cli-commands.html" in diff["changed"] and "index.html" in diff["changed"]
+    assert "05-cli-commands.html.gz" in diff["added"]
+    assert "01-audit-log-events.html" not in diff["changed"]
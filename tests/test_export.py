@@ -0,0 +1,55 @@
+import tarfile
+import time
+import zipfile
+
+import pytest
+
+import generate_topics
+from generate_topics import export_site, parse_args
+
+@pytest.mark.parametrize("name", ["site.zip", "site.tar.gz", "site.tgz", "site.html"])
+def test_export_is_byte_reproducible(tmp_path, name):
+    exports = []
+    for run in range(2):
+        output_dir = tmp_path / f"build{run}"
+        assert not generate_topics.generate_all_topics(output_dir)
+        target = tmp_path / f"{run}-{name}"
+        export_site(output_dir, target)
+        exports.append(target.read_bytes())
+        time.sleep(0.01)  # different file times for the second build
+    assert exports[0] == exports[1]
+
+def test_zip_lists_the_site_sorted_with_fixed_metadata(build, tmp_path):
+    output_dir, _ = build()
+    export_site(output_dir, tmp_path / "site.zip")
+    with zipfile.ZipFile(tmp_path / "site.zip") as archive:
+        infos = archive.infolist()
+        names = [info.filename for info in infos]
+        assert names == sorted(names)
+        assert {"index.html", "05-cli-commands.html", "01-audit-log-events.html", "search-index.json"} <= set(names)
+        assert {info.date_time for info in infos} == {generate_topics.ARCHIVE_DATE}
+        assert archive.read("05-cli-commands.html") == (output_dir / "05-cli-commands.html").read_bytes()
+
+def test_tar_gz_has_fixed_metadata(build, tmp_path):
+    output_dir, _ = build()
+    export_site(output_dir, tmp_path / "site.tar.gz")
+    with tarfile.open(tmp_path / "site.tar.gz") as archive:
+        members = archive.getmembers()
+        assert {(m.mtime, m.mode, m.uid, m.uname) for m in members} == {(0, generate_topics.ARCHIVE_MODE, 0, "")}
+
+def test_bundle_is_self_contained(build, tmp_path):
+    output_dir, _ = build(external_assets=True, offline=True)
+    export_site(output_dir, tmp_path / "site.html")
+    bundle = (tmp_path / "site.html").read_text(encoding="utf-8")
+    assert 'data-file="05-cli-commands.html"' in bundle
+    assert generate_topics.ASSET_PREFIX not in bundle
+    assert generate_topics.SERVICE_WORKER_NAME not in bundle
+
+def test_unsupported_export_format_is_rejected(build, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(["--export", "site.rar"])
+    assert "unsupported format" in capsys.readouterr().err
+    output_dir, _ = build()
+    with pytest.raises(ValueError):
+        export_site(output_dir, tmp_path / "site.rar")
+    assert not (tmp_path / "site.rar").exists()
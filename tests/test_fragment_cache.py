@@ -0,0 +1,61 @@
+import pytest
+
+import generate_topics
+from generate_topics import FragmentCache, fragment_key
+
+PAGE = "05-cli-commands.html"
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(generate_topics, "_fragment_caches", {})
+    generate_topics.fragment_version.cache_clear()
+    yield
+    generate_topics.fragment_version.cache_clear()
+
+def test_cached_build_matches_uncached_build(build, capsys):
+    output_dir, _ = build()
+    expected = (output_dir / PAGE).read_bytes()
+    capsys.readouterr()
+
+    build(fragment_cache=True)
+    assert "0 cached, 25 rendered" in capsys.readouterr().out
+    build(fragment_cache=True)
+    assert "25 cached, 0 rendered" in capsys.readouterr().out
+    assert (output_dir / PAGE).read_bytes() == expected
+
+def test_cache_survives_a_new_process(build, monkeypatch, capsys):
+    build(fragment_cache=True)
+    monkeypatch.setattr(generate_topics, "_fragment_caches", {})
+    capsys.readouterr()
+    build(fragment_cache=True)
+    assert "25 cached, 0 rendered" in capsys.readouterr().out
+
+def test_markup_change_invalidates_cached_fragments(build, monkeypatch, capsys):
+    output_dir, _ = build(fragment_cache=True)
+    qa_item = generate_topics.qa_item
+    monkeypatch.setattr(generate_topics, "qa_item",
+                        lambda *args: qa_item(*args).replace('class="qa-item"', 'class="qa-item new"'))
+    generate_topics.fragment_version.cache_clear()
+    monkeypatch.setattr(generate_topics, "_fragment_caches", {})
+    capsys.readouterr()
+
+    build(fragment_cache=True)
+    assert "0 cached, 25 rendered" in capsys.readouterr().out
+    assert (output_dir / PAGE).read_text(encoding="utf-8").count('class="qa-item new"') == 25
+
+def test_cache_file_from_other_markup_is_discarded(tmp_path, monkeypatch):
+    path = tmp_path / generate_topics.FRAGMENT_CACHE_NAME
+    cache = FragmentCache(path)
+    cache.put(fragment_key("q", "a", None, False), ["<div>q</div>", 12])
+    cache.save()
+    assert len(FragmentCache(path).entries) == 1
+
+    monkeypatch.setattr(generate_topics, "minify_html", lambda text: text)
+    generate_topics.fragment_version.cache_clear()
+    assert not FragmentCache(path).entries
+
+def test_cache_is_bounded(tmp_path):
+    cache = FragmentCache(tmp_path / "cache.json", max_bytes=10)
+    for key in "abc":
+        cache.put(key, ["x" * 4, 4])
+    assert list(cache.entries) == ["b", "c"]
@@ -0,0 +1,56 @@
+import generate_topics
+
+PAGE = "05-cli-commands.html"
+
+def test_incremental_build_skips_unchanged_topics(build, capsys):
+    output_dir, failures = build(incremental=True)
+    assert not failures
+    before = (output_dir / PAGE).stat().st_mtime_ns
+    capsys.readouterr()
+
+    build(incremental=True)
+    assert f"⏭️  Unchanged: {PAGE}" in capsys.readouterr().out
+    assert (output_dir / PAGE).stat().st_mtime_ns == before
+
+def mtimes(output_dir):
+    # The deploy manifest names the previous build, so it changes once
+    return {path.name: path.stat().st_mtime_ns for path in output_dir.iterdir()
+            if path.name != generate_topics.DEPLOY_MANIFEST_NAME}
+
+def test_full_build_does_not_rewrite_identical_files(build):
+    output_dir, _ = build()
+    before = mtimes(output_dir)
+    build()
+    assert mtimes(output_dir) == before
+
+def test_incremental_build_repairs_edited_output(build, capsys):
+    output_dir, _ = build(incremental=True)
+    expected = (output_dir / PAGE).read_bytes()
+    (output_dir / PAGE).write_bytes(b"edited")
+    capsys.readouterr()
+
+    build(incremental=True)
+    assert f"✅ Created: {PAGE}" in capsys.readouterr().out
+    assert (output_dir / PAGE).read_bytes() == expected
+
+def test_incremental_build_follows_option_changes(build, capsys):
+    output_dir, _ = build(incremental=True)
+    plain = (output_dir / PAGE).read_bytes()
+    capsys.readouterr()
+
+    build(incremental=True, minify=True)
+    assert f"✅ Created: {PAGE}" in capsys.readouterr().out
+    assert len((output_dir / PAGE).read_bytes()) < len(plain)
+
+def test_input_hash_covers_the_page_markup(monkeypatch):
+    topic = generate_topics.get_topic(5)
+    qa_list = generate_topics.load_qa(topic)
+    options = {"per_page": 10, "lazy_answers": True}
+    original = generate_topics.topic_input_hash(topic, qa_list, options)
+    assert generate_topics.topic_input_hash(topic, qa_list, options) == original
+
+    for name in ("get_pager", "lazy_answers_block", "topic_footer"):
+        with monkeypatch.context() as patch:
+            render = getattr(generate_topics, name)
+            patch.setattr(generate_topics, name, lambda *args, render=render: render(*args) + "<!-- new -->")
+            assert generate_topics.topic_input_hash(topic, qa_list, options) != original, name
@@ -0,0 +1,22 @@
+import pytest
+
+from generate_topics import minify_html
+
+def test_minify_collapses_whitespace():
+    assert minify_html("<div>\n    <p>a   b\n   c</p>\n</div>\n") == "<div><p>a b c</p></div>"
+
+@pytest.mark.parametrize("block", [
+    "<pre>  two  spaces\n    indented\n</pre>",
+    '<textarea name="t">\n  kept  as  is\n</textarea>',
+    "<script>\n  if (a  &&  b) {\n    go();\n  }\n</script>",
+    '<div class="code-block">gh  copilot\n    suggest  "x"</div>',
+])
+def test_minify_preserves_whitespace_sensitive_blocks(block):
+    assert block in minify_html(f"<div>\n    <p>before</p>\n    {block}\n    <p>after</p>\n</div>")
+
+def test_minify_keeps_textarea_inline_spacing():
+    assert minify_html("<p>Edit <textarea>x</textarea> here</p>") == "<p>Edit <textarea>x</textarea> here</p>"
+
+def test_minify_keeps_non_breaking_spaces():
+    text = "<p>a\u00a0\u00a0b &nbsp; c</p>"
+    assert minify_html(text) == text
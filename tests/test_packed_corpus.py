@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+import generate_topics
+from benchmark_topics import SyntheticQA
+from packed_corpus import PackedCorpus, PackedTopic, pack_corpus
+
+def write_pack(path, topics):
+    with open(path, "wb") as f:
+        pack_corpus(f, topics)
+
+def test_packed_corpus_round_trip(tmp_path):
+    topics = [
+        (3, (123456789, 42), [("Q one?", "A one"), ("Q two — ünïcode?", "<b>A two</b>"), ("", "")]),
+        (7, None, []),
+        (11, (1, 2), SyntheticQA(50, 5)),
+    ]
+    path = tmp_path / "corpus.qapk"
+    write_pack(path, topics)
+
+    corpus = PackedCorpus(path)
+    assert sorted(corpus.topics) == [3, 7, 11]
+    assert corpus.source_signature(3) == (123456789, 42)
+    assert corpus.source_signature(7) == (0, 0)
+    for num, _, qa_list in topics:
+        assert list(corpus.topic(num)) == list(qa_list)
+
+    topic = corpus.topic(3)
+    assert len(topic) == 3
+    assert topic[-1] == ("", "")
+    assert topic[1:] == [("Q two — ünïcode?", "<b>A two</b>"), ("", "")]
+    assert [bytes(part) for part in topic.raw(1)] == ["Q two — ünïcode?".encode(), b"<b>A two</b>"]
+    with pytest.raises(IndexError):
+        topic[3]
+
+def test_packed_corpus_rejects_bad_files(tmp_path):
+    path = tmp_path / "corpus.qapk"
+    write_pack(path, [(1, None, [("question", "answer")])])
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        PackedCorpus(path)
+    path.write_bytes(b"JUNK" + data[4:])
+    with pytest.raises(ValueError, match="not a version"):
+        PackedCorpus(path)
+
+# load_qa() and the corpus next to the JSON Lines files
+
+QA = [("What is it?", "A test."), ("And then?", "<ul><li>More</li></ul>")]
+TOPIC = {"num": 42, "source": "42-test.jsonl"}
+
+@pytest.fixture
+def content_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_topics, "CONTENT_DIR", tmp_path)
+    with open(tmp_path / TOPIC["source"], "w", encoding="utf-8") as f:
+        for q, a in QA:
+            f.write(json.dumps({"question": q, "answer": a}) + "\n")
+    return tmp_path
+
+def test_load_qa_uses_an_up_to_date_corpus(content_dir):
+    signature = generate_topics.file_signature(content_dir / TOPIC["source"])
+    write_pack(content_dir / generate_topics.CORPUS_NAME, [(TOPIC["num"], signature, QA)])
+    qa_list = generate_topics.load_qa(TOPIC)
+    assert isinstance(qa_list, PackedTopic)
+    assert list(qa_list) == QA
+
+def test_load_qa_ignores_a_stale_corpus_section(content_dir):
+    write_pack(content_dir / generate_topics.CORPUS_NAME, [(TOPIC["num"], (1, 2), [("Old?", "Old.")])])
+    assert generate_topics.load_qa(TOPIC) == QA
+
+@pytest.mark.parametrize("damage", ["empty", "truncated", "version"])
+def test_load_qa_falls_back_to_json_lines_on_a_bad_corpus(content_dir, capsys, damage):
+    path = content_dir / generate_topics.CORPUS_NAME
+    signature = generate_topics.file_signature(content_dir / TOPIC["source"])
+    write_pack(path, [(TOPIC["num"], signature, QA)])
+    data = path.read_bytes()
+    path.write_bytes({"empty": b"", "truncated": data[:-5],
+                      "version": data[:4] + (99).to_bytes(4, "little") + data[8:]}[damage])
+
+    assert generate_topics.load_qa(TOPIC) == QA
+    assert "Ignoring unreadable packed corpus" in capsys.readouterr().out
+
+def test_load_qa_reads_a_removed_file_from_the_corpus(content_dir):
+    path = content_dir / TOPIC["source"]
+    write_pack(content_dir / generate_topics.CORPUS_NAME,
+               [(TOPIC["num"], generate_topics.file_signature(path), QA)])
+    os.remove(path)
+    assert list(generate_topics.load_qa(TOPIC)) == QA
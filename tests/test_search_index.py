@@ -0,0 +1,48 @@
+import json
+
+import generate_topics
+from generate_topics import (STOP_WORDS, build_search_index, question_anchor, search_files,
+                             SEARCH_INDEX_NAME, SITE_DIR, tokenize)
+
+TOPIC = {"num": 1, "filename": "01-test.html", "title": "Test topic"}
+QA = [
+    ("How do you configure the proxy?", "Set <code>http_proxy</code> in the environment."),
+    ("What is a seat?", "A licence assigned to one user; the proxy is not involved."),
+    ("Where are logs kept?", "In the audit log &amp; the usage export."),
+]
+
+def terms(index, term):
+    """{doc: weight} for a term's postings."""
+    flat = index["terms"].get(term, [])
+    return dict(zip(flat[::2], flat[1::2]))
+
+def test_tokenize_drops_markup_entities_and_stop_words():
+    assert tokenize("<b>What</b> is the audit&nbsp;log &amp; a CLI_tool?") == ["audit", "log", "cli", "tool"]
+
+def test_index_links_each_question_to_its_page_and_anchor():
+    index = build_search_index([(TOPIC, QA)])
+    assert index["pages"] == [["01-test.html", "Test topic"]]
+    assert index["docs"] == [[0, q, question_anchor(q)] for q, _ in QA]
+
+def test_index_leaves_out_stop_words_and_lists_them():
+    index = build_search_index([(TOPIC, QA)])
+    assert not STOP_WORDS & set(index["terms"])
+    assert index["stop"] == sorted(STOP_WORDS)
+    assert set(terms(index, "logs")) == {2} and set(terms(index, "audit")) == {2}
+
+def test_question_words_outweigh_answer_words():
+    index = build_search_index([(TOPIC, QA)])
+    proxy = terms(index, "proxy")
+    assert set(proxy) == {0, 1}
+    assert proxy[0] > proxy[1]
+
+def test_index_follows_pagination():
+    index = build_search_index([(TOPIC, QA)], per_page=2)
+    assert index["pages"] == [["01-test.html", "Test topic"], ["01-test-2.html", "Test topic (page 2)"]]
+    assert [doc[0] for doc in index["docs"]] == [0, 0, 1]
+
+def test_committed_search_files_are_up_to_date():
+    topics = [(topic, generate_topics.load_qa(topic)) for topic in generate_topics.generated_topics()]
+    for name, data in search_files(topics).items():
+        assert (SITE_DIR / name).read_bytes() == data, f"{name} is stale; run generate_topics.py"
+    assert json.loads((SITE_DIR / SEARCH_INDEX_NAME).read_text(encoding="utf-8"))["docs"]
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from serve_topics import TopicServer, parse_range
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 999)),
+    ("bytes=-100", (900, 999)),
+    ("bytes=-5000", (0, 999)),
+    ("bytes=990-5000", (990, 999)),
+    (" bytes=5-5 ", (5, 5)),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+@pytest.mark.parametrize("header", ["bytes=-", "items=0-9", "bytes=0-9,20-29", "bytes=a-b", ""])
+def test_parse_range_ignores_malformed_headers(header):
+    assert parse_range(header, 1000) is None
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=50-10"])
+def test_parse_range_rejects_unsatisfiable_ranges(header):
+    with pytest.raises(ValueError):
+        parse_range(header, 1000)
+
+# Responses
+
+class FakeServer(TopicServer):
+    """A TopicServer whose one page has both precompressed variants."""
+
+    async def lookup(self, name):
+        if name != "page.html":
+            return None
+        return {"body": b"identity", "etag": "abc", "variants": {"gzip": b"gz", "br": b"br"}}
+
+class FakeWriter:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+def respond(headers):
+    return asyncio.run(FakeServer().respond("GET", "/page.html", headers))
+
+@pytest.mark.parametrize("accept, coding", [
+    ("gzip, deflate, br", "br"),
+    ("br;q=0, gzip", "gzip"),
+    ("gzip", "gzip"),
+    ("identity", None),
+])
+def test_respond_prefers_brotli(accept, coding):
+    status, headers, body = respond({"accept-encoding": accept})
+    assert status == 200
+    assert headers.get("Content-Encoding") == coding
+    assert body == {"br": b"br", "gzip": b"gz", None: b"identity"}[coding]
+
+def test_range_requests_ignore_encodings():
+    status, headers, body = respond({"accept-encoding": "br", "range": "bytes=0-1"})
+    assert (status, body, headers["Content-Range"]) == (206, b"id", "bytes 0-1/8")
+    assert "Content-Encoding" not in headers
+
+def test_not_modified_has_no_content_length():
+    status, headers, body = respond({"accept-encoding": "br", "if-none-match": '"abc-br"'})
+    assert status == 304 and body == b""
+    writer = FakeWriter()
+    asyncio.run(TopicServer.send(writer, "GET", status, headers, body, True))
+    head = writer.data.decode("latin-1")
+    assert head.startswith("HTTP/1.1 304 Not Modified\r\n") and head.endswith("\r\n\r\n")
+    assert "Content-Length" not in head and 'ETag: "abc-br"' in head
+
+def test_ok_has_content_length():
+    writer = FakeWriter()
+    asyncio.run(TopicServer.send(writer, "HEAD", 200, {}, b"12345", False))
+    assert b"Content-Length: 5\r\n" in writer.data and writer.data.endswith(b"\r\n\r\n")
@@ -0,0 +1,43 @@
+import hashlib
+
+import pytest
+
+import generate_topics
+from benchmark_topics import SyntheticQA
+
+SYNTHETIC_TOPIC = {
+    "num": 0,
+    "filename": "synthetic.html",
+    "title": "Synthetic topic",
+    "subtitle": "Tests",
+}
+
+def stream_bytes(tmp_path, topic, qa_list, options=None):
+    filepath = tmp_path / topic["filename"]
+    _, digest, size, _ = generate_topics.write_stream(
+        filepath, generate_topics.iter_topic(topic, qa_list, options))
+    data = filepath.read_bytes()
+    assert hashlib.sha256(data).hexdigest() == digest and len(data) == size
+    return data
+
+@pytest.mark.parametrize("options", [
+    None,
+    {"minify": True},
+    {"lazy_answers": True},
+    {"minify": True, "lazy_answers": True},
+])
+def test_stream_matches_render_topic(tmp_path, options):
+    topic = generate_topics.get_topic(5)
+    qa_list = generate_topics.load_qa(topic, packed=False)
+    expected = generate_topics.encode_page(generate_topics.render_topic(topic, qa_list, options))
+    assert stream_bytes(tmp_path, topic, qa_list, options) == expected
+
+def test_stream_matches_render_topic_large(tmp_path):
+    qa_list = SyntheticQA(100_000, 40)
+    expected = generate_topics.encode_page(generate_topics.render_topic(SYNTHETIC_TOPIC, qa_list))
+    assert stream_bytes(tmp_path, SYNTHETIC_TOPIC, qa_list) == expected
+
+def test_stream_keeps_crlf_line_endings(tmp_path):
+    data = stream_bytes(tmp_path, SYNTHETIC_TOPIC, SyntheticQA(3, 5))
+    assert b"\r\n" in data
+    assert b"\n" not in data.replace(b"\r\n", b"")
@@ -0,0 +1,60 @@
+import pytest
+
+import generate_topics
+from generate_topics import load_manifest, validate_site
+
+PAGE = "05-cli-commands.html"
+
+@pytest.fixture
+def site(build):
+    output_dir, failures = build(validate=True)
+    assert not failures
+    return output_dir
+
+def edit_page(output_dir, old, new):
+    path = output_dir / PAGE
+    text = path.read_text(encoding="utf-8")
+    assert old in text
+    path.write_text(text.replace(old, new, 1), encoding="utf-8")
+
+def problems(output_dir, **kwargs):
+    return [(page, str(problem)) for page, problem in
+            validate_site(output_dir, load_manifest(output_dir), **kwargs)]
+
+def test_built_site_is_valid(site):
+    assert problems(site) == []
+
+def test_broken_link_is_reported(site):
+    edit_page(site, '<div class="content">', '<div class="content"><a href="missing.html">x</a>')
+    assert [(page, message.split(": ", 1)[1]) for page, message in problems(site)] == \
+        [(PAGE, "broken link 'missing.html'")]
+
+def test_files_deployed_alongside_count_as_present(site):
+    edit_page(site, '<div class="content">', '<div class="content"><a href="guide.pdf">x</a>')
+    assert problems(site, alongside=["guide.pdf"]) == []
+
+def test_missing_anchor_is_reported(site):
+    edit_page(site, '<div class="content">', '<div class="content"><a href="06-usage-analytics.html#q-nope">x</a>')
+    [(page, message)] = problems(site)
+    assert page == PAGE and message.endswith("missing anchor '06-usage-analytics.html#q-nope'")
+
+def test_navigation_out_of_registry_order_is_reported(site):
+    edit_page(site, '<a href="06-usage-analytics.html">Next Topic →</a>', '<a href="07-effective-prompting.html">Next Topic →</a>')
+    [(page, message)] = problems(site)
+    assert page == PAGE and message.startswith("navigation ")
+
+def test_duplicate_ids_are_reported(site):
+    anchor = generate_topics.question_anchor(generate_topics.load_qa(generate_topics.get_topic(5))[0][0])
+    edit_page(site, '<div class="content">', f'<div class="content"><p id="{anchor}"></p>')
+    [(page, message)] = problems(site)
+    assert page == PAGE and f"duplicate id '{anchor}'" in message
+
+def test_invalid_site_fails_the_build_before_the_deploy_manifest(build, monkeypatch):
+    output_dir, _ = build()
+    deploy_manifest = (output_dir / generate_topics.DEPLOY_MANIFEST_NAME).read_bytes()
+    (output_dir / "01-audit-log-events.html").write_text('<a href="gone.html">x</a>', encoding="utf-8")
+    # Keep the build from copying the hand-written page over the broken one
+    monkeypatch.setattr(generate_topics, "write_static_pages", lambda *args: None)
+    _, failures = build(validate=True)
+    assert {page for page, _ in failures} == {"01-audit-log-events.html"}
+    assert (output_dir / generate_topics.DEPLOY_MANIFEST_NAME).read_bytes() == deploy_manifest
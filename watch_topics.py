@@ -0,0 +1,165 @@
+"""
+GitHub Copilot Q&A Generator - watch mode
+Builds once, then rebuilds the topics whose content files change, with an
+optional live-reloading preview server. Run through
+generate_topics.py --watch [--serve PORT].
+"""
+
+import os
+import sys
+import time
+import ctypes
+import select
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from generate_topics import CONTENT_DIR, OUTPUT_DIR, generate_all_topics, source_signatures
+
+# inotify event masks (see inotify(7))
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+
+# Seconds between checks when inotify is unavailable, and to let editors finish saving
+POLL_INTERVAL = 0.25
+WATCH_DEBOUNCE = 0.02
+
+RELOAD_PATH = "/__reload"
+RELOAD_SNIPPET = """<script>
+new EventSource('""" + RELOAD_PATH + """').onmessage = function() { location.reload(); };
+</script>
+"""
+
+def inotify_waiter(directory):
+    """Return a wait(timeout) function woken by inotify events in directory.
+
+    Returns None where inotify is not available, so callers can poll instead.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    mask = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+
+    def wait(timeout):
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if ready:
+            # Only the wake-up matters; which files changed is worked out from their stats
+            try:
+                while os.read(fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        return bool(ready)
+    return wait
+
+def poll_waiter(timeout):
+    time.sleep(POLL_INTERVAL)
+    return True
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """Serves the output directory, injecting a live-reload hook into pages."""
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def do_GET(self):
+        if self.path == RELOAD_PATH:
+            return self.send_reload_events()
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+        if path.suffix != ".html" or not path.is_file():
+            return super().do_GET()
+        body = path.read_bytes().replace(b"</body>", RELOAD_SNIPPET.encode("utf-8") + b"</body>", 1)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_reload_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        server = self.server
+        with server.rebuilt:
+            seen = server.generation
+        try:
+            while True:
+                with server.rebuilt:
+                    server.rebuilt.wait_for(lambda: server.generation != seen, timeout=15)
+                    changed = server.generation != seen
+                    seen = server.generation
+                # A comment line doubles as a keep-alive
+                self.wfile.write(b"data: reload\n\n" if changed else b": ping\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def start_preview_server(output_dir, port):
+    server = ThreadingHTTPServer(("127.0.0.1", port),
+                                 partial(PreviewHandler, directory=str(output_dir)))
+    server.daemon_threads = True
+    server.generation = 0
+    server.rebuilt = threading.Condition()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"🌐 Preview: http://127.0.0.1:{server.server_address[1]}/")
+    return server
+
+def watch_topics(output_dir=OUTPUT_DIR, serve_port=None, **build_options):
+    """Build once, then rebuild only the topics whose content files change.
+
+    Runs until interrupted. The process stays warm, so unchanged content
+    stays parsed in the load_qa() cache between rebuilds. With serve_port,
+    a local preview server reloads open pages after each rebuild.
+    """
+    build_options.pop("jobs", None)
+    build_options.pop("topics", None)
+    generate_all_topics(output_dir, **build_options)
+    server = start_preview_server(output_dir, serve_port) if serve_port is not None else None
+
+    wait = inotify_waiter(CONTENT_DIR)
+    print(f"👀 Watching {CONTENT_DIR} ({'inotify' if wait else 'polling'}) - Ctrl+C to stop")
+    wait = wait or poll_waiter
+    signatures = source_signatures()
+    try:
+        while True:
+            if not wait(1.0):
+                continue
+            time.sleep(WATCH_DEBOUNCE)
+            current = source_signatures()
+            changed = [num for num, signature in current.items() if signatures.get(num) != signature]
+            signatures = current
+            if not changed:
+                continue
+            start = time.perf_counter()
+            failures = generate_all_topics(output_dir, **dict(build_options, incremental=True, topics=changed))
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"🔁 Rebuilt {len(changed)} topic(s) in {elapsed:.0f} ms"
+                  + (f" with {len(failures)} failure(s)" if failures else ""))
+            if server and not failures:
+                with server.rebuilt:
+                    server.generation += 1
+                    server.rebuilt.notify_all()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        if server:
+            server.shutdown()